@@ -56,8 +56,11 @@ def main():
             status_callback=status_callback,
             progress_callback=progress_callback
         )
-        updater.load_file(args.fw_file)
-        updater.run()
+        try:
+            updater.load_file(args.fw_file)
+            updater.run()
+        finally:
+            updater.close()
 
 
 if __name__ == "__main__":
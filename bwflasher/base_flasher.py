@@ -20,11 +20,16 @@
 
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from typing import Tuple
 
 from bwflasher.utils import load_and_process_firmware, process_firmware
 
 
+# Number of bytes get_firmware_info_header() needs to identify a firmware
+FIRMWARE_HEADER_SIZE = 0x1000
+
+
 class FirmwareType(Enum):
     """Enum to identify firmware types"""
     BRIGHTWAY = "Brightway"
@@ -41,6 +46,9 @@ class FlasherException(Exception):
 class BaseFlasher(ABC):
     """Abstract base class for firmware flashers"""
 
+    # The firmware type detect_firmware_type() reports for this flasher
+    FIRMWARE_TYPE = FirmwareType.UNKNOWN
+
     def __init__(
         self,
         tty_port: str = "/dev/ttyUSB0",
@@ -57,11 +65,19 @@ class BaseFlasher(ABC):
         self.progress_callback = progress_callback
         self.log_callback = log_callback
         self.fw = None
+        self.serial_conn = None
+        self.cancel_requested = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Loading is the one step a flasher may implement either way
+        if cls.load_file is BaseFlasher.load_file and not hasattr(cls, 'load_bytes'):
+            raise TypeError(f"{cls.__name__} must implement load_bytes() or load_file()")
 
-    @abstractmethod
     def load_file(self, firmware_file: str):
-        """Load firmware file"""
-        pass
+        """Load firmware file, flashers implement this or load_bytes(firmware_data)"""
+        with open(firmware_file, 'rb') as f:
+            self.load_bytes(f.read())
 
     @abstractmethod
     def run(self):
@@ -79,6 +95,20 @@ class BaseFlasher(ABC):
         """Detect the firmware type from binary data"""
         pass
 
+    def cancel(self):
+        """Ask the running operation to stop at the next safe point"""
+        self.cancel_requested = True
+
+    def check_cancelled(self):
+        """Abort the running operation if cancel() was called"""
+        if self.cancel_requested:
+            raise FlasherException("Operation cancelled")
+
+    def close(self):
+        """Close the serial connection if it is open"""
+        if self.serial_conn and self.serial_conn.is_open:
+            self.serial_conn.close()
+
     def log(self, *message):
         """Log a message via callback"""
         if self.log_callback:
@@ -100,18 +130,24 @@ class BaseFlasher(ABC):
         if self.status_callback:
             self.status_callback(status_text)
 
+@lru_cache(maxsize=None)
 def _get_flasher_classes():
     from bwflasher.brightway_flasher import BrightwayFlasher
     from bwflasher.leqi_flasher import LeqiFlasher
     #from bwflasher.ninebot_flasher import NinebotFlasher
-    return [BrightwayFlasher, LeqiFlasher]
+    return (BrightwayFlasher, LeqiFlasher)
 
-def detect_firmware_type(firmware_data: bytes) -> FirmwareType:
-    for flasher_class in _get_flasher_classes():
+def _detect_flasher(firmware_data: bytes):
+    """Return the firmware type and the flasher class for it, the first one if unknown"""
+    flasher_classes = _get_flasher_classes()
+    for flasher_class in flasher_classes:
         fw_type = flasher_class.detect_firmware_type(firmware_data)
         if fw_type != FirmwareType.UNKNOWN:
-            return fw_type
-    return FirmwareType.UNKNOWN
+            return fw_type, flasher_class
+    return FirmwareType.UNKNOWN, flasher_classes[0]
+
+def detect_firmware_type(firmware_data: bytes) -> FirmwareType:
+    return _detect_flasher(firmware_data)[0]
 
 def detect_firmware_file(firmware_file: str) -> FirmwareType:
     try:
@@ -120,12 +156,46 @@ def detect_firmware_file(firmware_file: str) -> FirmwareType:
     except Exception:
         return FirmwareType.UNKNOWN
 
+def get_flasher_class(firmware_file: str):
+    firmware_data = load_and_process_firmware(firmware_file)
+    return _detect_flasher(firmware_data)[1]
+
+def get_flasher_class_for_type(fw_type: FirmwareType):
+    """Return the flasher class for an already detected firmware type, the first one if unknown"""
+    flasher_classes = _get_flasher_classes()
+    for flasher_class in flasher_classes:
+        if flasher_class.FIRMWARE_TYPE == fw_type:
+            return flasher_class
+    return flasher_classes[0]
+
 def create_flasher_for_firmware(firmware_file: str, **kwargs):
-    fw_type = detect_firmware_file(firmware_file)
-    for flasher_class in _get_flasher_classes():
-        if flasher_class.detect_firmware_type(load_and_process_firmware(firmware_file)) == fw_type:
-            return flasher_class(**kwargs)
-    raise ValueError(f"Unknown firmware type for file: {firmware_file}")
+    return get_flasher_class(firmware_file)(**kwargs)
+
+def get_firmware_info_header(header: bytes, size: int = None) -> Tuple[FirmwareType, dict]:
+    """
+    Get firmware info from the first FIRMWARE_HEADER_SIZE bytes of a file.
+
+    Only firmware carrying the Brightway signature can be identified this way.
+    Anything else (ZIP archives, encrypted or LEQI images) is reported as
+    FirmwareType.UNKNOWN and needs the complete data passed to get_firmware_info().
+    """
+    from bwflasher.brightway_flasher import BrightwayFlasher
+
+    header = header[:FIRMWARE_HEADER_SIZE]
+    fw_type = FirmwareType.UNKNOWN
+    if not header.startswith(b'PK\x03\x04'):
+        # The pattern fallback only matches past the header, so this is the signature check
+        fw_type = BrightwayFlasher.detect_firmware_type(header)
+
+    info = {'type': fw_type}
+    if size is not None:
+        info['size'] = size
+
+    if fw_type == FirmwareType.BRIGHTWAY:
+        info['signature'] = header[0x800:0x807].decode('ascii', errors='ignore')
+        info['protocol'] = "DFU (Device Firmware Update)"
+
+    return fw_type, info
 
 def get_firmware_info(firmware_data: bytes) -> Tuple[FirmwareType, dict]:
     data = process_firmware(firmware_data)
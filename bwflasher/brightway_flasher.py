@@ -49,6 +49,7 @@ def calculate_crc32(data: bytearray) -> int:
 class BrightwayFlasher(BaseFlasher):
     """Flasher for Brightway scooter firmware (DFU protocol)"""
 
+    FIRMWARE_TYPE = FirmwareType.BRIGHTWAY
     PACKET_SIZE = 0x800
     CHUNK_SIZE = 0x80
     CHUNKS_PER_PACKET = PACKET_SIZE // CHUNK_SIZE
@@ -96,10 +97,9 @@ class BrightwayFlasher(BaseFlasher):
         offset_1 = offsets[0] - 1
         self.fw_offsets = [offset_0, offset_1]
 
-    def load_file(self, firmware_file):
+    def load_bytes(self, firmware_data):
         self.debug_log("Loading firmware file")
-        with open(firmware_file, 'rb') as fw:
-            self.fw = fw.read()
+        self.fw = firmware_data
 
         # Verify this is Brightway firmware
         if self.detect_firmware_type(self.fw) != FirmwareType.BRIGHTWAY:
@@ -133,6 +133,21 @@ class BrightwayFlasher(BaseFlasher):
 
         return FirmwareType.UNKNOWN
 
+    def reset_session(self):
+        """Reset the protocol state so the open connection can be reused"""
+        self.mcu_rand = None
+        self.retries = 0
+        self.prev_state = DFUState.UID
+        self.state = DFUState.UID
+        self.packet = None
+        self.data_sent = bytes()
+        self.n_packets_sent = 0
+        self.uid = None
+        self.cancel_requested = False
+
+        if self.serial_conn:
+            self.serial_conn.reset_input_buffer()
+
     def emit_state(self, state_text):
         if self.prev_state != self.state:
             self.emit_status(state_text)
@@ -144,7 +159,9 @@ class BrightwayFlasher(BaseFlasher):
             self.emit_progress(perc)
 
     def run(self):
+        self.reset_session()
         while self.state != DFUState.DONE:
+            self.check_cancelled()
             if self.state == DFUState.UID:
                 self.emit_state(f"{self.state} -> Fetching UID")
                 self.get_uid()
@@ -188,8 +205,10 @@ class BrightwayFlasher(BaseFlasher):
         self.emit_state(f"{self.state} -> Enjoy!")
 
     def test_connection(self):
+        self.reset_session()
         retries = 0
         while self.state != DFUState.INIT:
+            self.check_cancelled()
             if self.state != self.prev_state:
                 retries = 0
 
@@ -356,15 +375,32 @@ class BrightwayFlasher(BaseFlasher):
             raise FlasherException("Activate failed")
 
     def send(self, data: bytearray):
-        tx_hex = data.hex(' ').upper()
-        self.debug_log(f"TX: {tx_hex}")
+        if self.debug:
+            tx_hex = data.hex(' ').upper()
+            self.debug_log(f"TX: {tx_hex}")
         if self.simulation:
             self.simulation_tx_buf = data
         else:
             self.serial_conn.write(data)
             self.serial_conn.flush()
 
-    def receive_response(self, expected_n_bytes, expected_byte='\r') -> bytes:
+    def read_reply(self, min_bytes) -> bytes:
+        """
+        Read a '\r' terminated reply of at least min_bytes, returning as soon
+        as it is complete instead of waiting for the read timeout. Replies can
+        carry binary keys containing '\r', so an earlier '\r' doesn't end them.
+        """
+        reply = bytearray()
+        while True:
+            c = self.serial_conn.read(1)
+            if not c:
+                break
+            reply += c
+            if len(reply) >= min_bytes and c == b'\r':
+                break
+        return bytes(reply)
+
+    def receive_response(self, expected_n_bytes, expected_byte=None) -> bytes:
         if self.simulation:
             time.sleep(0.01)
             response = None
@@ -385,11 +421,16 @@ class BrightwayFlasher(BaseFlasher):
                 response = b'ok\r'
 
             # Log simulated RX
-            rx_hex = response.hex(' ').upper()
-            self.debug_log(f"RX: {rx_hex} ({len(response)} bytes)")
+            if self.debug:
+                rx_hex = response.hex(' ').upper()
+                self.debug_log(f"RX: {rx_hex} ({len(response)} bytes)")
             return response
         else:
-            response = self.serial_conn.read_until(expected_byte)[-expected_n_bytes:]
-            rx_hex = response.hex(' ').upper()
-            self.debug_log(f"RX: {rx_hex} ({len(response)} bytes)")
+            if expected_byte is None:
+                response = self.read_reply(expected_n_bytes)[-expected_n_bytes:]
+            else:
+                response = self.serial_conn.read_until(expected_byte)[-expected_n_bytes:]
+            if self.debug:
+                rx_hex = response.hex(' ').upper()
+                self.debug_log(f"RX: {rx_hex} ({len(response)} bytes)")
             return response
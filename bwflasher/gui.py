@@ -22,45 +22,150 @@ import serial.tools.list_ports
 import sys
 import os
 import platform
-import webbrowser
-import requests
+import threading
+import time
+from collections import deque
 
 from serial.serialutil import SerialException
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QProgressBar, QFileDialog, QCheckBox, QTextEdit, QStatusBar, QComboBox, QMessageBox
+    QProgressBar, QFileDialog, QCheckBox, QTextEdit, QStatusBar, QComboBox, QMessageBox,
+    QDialog, QDialogButtonBox, QStyle, QPlainTextEdit, QFrame
+)
+from PySide6.QtGui import (
+    QPalette, QIcon, QColor, QCursor, QPainter, QFont, QLinearGradient, QRadialGradient, QPixmap, QImage, QBrush,
+    QTextCursor, QTextOption
+)
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QUrl, QTimer, QEvent, QStandardPaths, QSettings, QObject, QAbstractNativeEventFilter
 )
-from PySide6.QtGui import QPalette, QIcon, QColor, QCursor, QPainter, QFont, QLinearGradient, QRadialGradient
-from PySide6.QtCore import Qt, QThread, Signal, QUrl, QTimer
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 from bwflasher.flash_uart import DFU, FlasherException
 from bwflasher.updater import check_update, get_name
-from bwflasher.styles import DARK_THEME_STYLESHEET, COLOR_PALETTE
+from bwflasher.styles import get_dark_theme_stylesheet, COLOR_PALETTE
 from bwflasher.version import __version__
-from bwflasher.base_flasher import detect_firmware_file, create_flasher_for_firmware, get_firmware_info, FirmwareType
+from bwflasher.base_flasher import (
+    get_flasher_class_for_type, get_firmware_info, get_firmware_info_header, FirmwareType, FIRMWARE_HEADER_SIZE
+)
 
 OS = platform.system()
 
+# Serial adapters show up under a fixed device prefix, except on Windows
+if OS == "Windows":
+    _PORT_PREFIX = None
+elif OS == "Linux":
+    _PORT_PREFIX = "/dev/ttyUSB"
+else:
+    _PORT_PREFIX = "/dev/cu.usbserial"
+
+
+# PyInstaller creates a temp folder and stores path in _MEIPASS
+_RES_DIR = os.path.join(getattr(sys, "_MEIPASS", None) or os.path.abspath("."), "resources")
+
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+    return os.path.join(_RES_DIR, relative_path)
+
 
-    return os.path.join(base_path, "resources", relative_path)
+# Enumerating ports is slow on some systems, calls close together share a scan
+PORTS_CACHE_TTL = 2.0  # seconds
+_ports_cache = (0.0, None)  # (monotonic time of the scan, ports)
 
 
-def get_serial_ports():
-    ports = serial.tools.list_ports.comports()
+def _scan_serial_ports():
     if OS == "Windows":
-        return [port[0] for port in ports] if ports else []
-    else:
-        prefix = "/dev/ttyUSB" if OS == "Linux" else "/dev/cu.usbserial"
-        return [port[0] for port in ports if port[0].startswith(prefix)] if ports else []
+        # The registry lists the COM ports directly, far quicker than going through SetupAPI
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DEVICEMAP\SERIALCOMM") as key:
+                ports = []
+                for i in range(winreg.QueryInfoKey(key)[1]):
+                    ports.append(winreg.EnumValue(key, i)[1])
+                return ports
+        except OSError:
+            pass
+    ports = [port.device for port in serial.tools.list_ports.comports()]
+    if _PORT_PREFIX:
+        ports = [port for port in ports if port.startswith(_PORT_PREFIX)]
+    return ports
+
+
+def get_serial_ports(force=False):
+    """List the serial adapters, rescanning only if forced or the last scan is stale"""
+    global _ports_cache
+    scanned_at, ports = _ports_cache
+    now = time.monotonic()
+    if force or ports is None or now - scanned_at >= PORTS_CACHE_TTL:
+        ports = _scan_serial_ports()
+        _ports_cache = (now, ports)
+    return list(ports)
+
+
+class _DeviceChangeFilter(QAbstractNativeEventFilter):
+    """Spot WM_DEVICECHANGE broadcasts among the Windows messages"""
+    WM_DEVICECHANGE = 0x0219
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if bytes(event_type) == b"windows_generic_MSG":
+            import ctypes.wintypes
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == self.WM_DEVICECHANGE:
+                self.callback()
+        return False, 0
+
+
+class SerialHotplug(QObject):
+    """
+    Signal when serial adapters are plugged in or removed, so the port list
+    only has to be scanned then. Uses udev on Linux (if the optional pyudev
+    is installed) and device change messages on Windows; elsewhere it never
+    fires and the list is only refreshed on demand.
+    """
+    ports_changed = Signal()
+    _device_event = Signal()
+
+    # Plugging in one adapter produces a burst of events
+    DEBOUNCE_INTERVAL = 200  # milliseconds
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._observer = None
+        self._native_filter = None
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_INTERVAL)
+        self._debounce.timeout.connect(self.ports_changed)
+        # udev events arrive on the observer thread, hop over to ours
+        self._device_event.connect(self._debounce.start, Qt.QueuedConnection)
+
+        if OS == "Linux":
+            try:
+                # Optional, see the "hotplug" extra
+                import pyudev
+                monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                monitor.filter_by('tty')
+                self._observer = pyudev.MonitorObserver(monitor, callback=lambda device: self._device_event.emit())
+                self._observer.start()
+            except Exception:
+                self._observer = None
+        elif OS == "Windows":
+            self._native_filter = _DeviceChangeFilter(self._device_event.emit)
+            QApplication.instance().installNativeEventFilter(self._native_filter)
+
+    def stop(self):
+        self._debounce.stop()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        if self._native_filter is not None:
+            QApplication.instance().removeNativeEventFilter(self._native_filter)
+            self._native_filter = None
 
 
 class BaseThread(QThread):
@@ -69,127 +174,227 @@ class BaseThread(QThread):
     debug_signal = Signal(str)
     exception_signal = Signal(list)
 
-    def __init__(self, com_port, firmware_file, simulation, debug, firmware_type=None, parent=None):
+    # Log lines are sent to the GUI in batches to save on text layout passes
+    LOG_BATCH_LINES = 16
+    LOG_BATCH_INTERVAL = 0.05  # seconds
+    # Progress updates faster than the display refresh are never seen
+    PROGRESS_INTERVAL = 0.033  # seconds
+
+    def __init__(self, flasher, firmware_file, parent=None):
         super().__init__(parent)
-        self.com_port = com_port
+        self.flasher = flasher
         self.firmware_file = firmware_file
-        self.simulation = simulation
-        self.debug = debug
-        self.firmware_type = firmware_type
+        self._log_buf = []
+        self._log_last = 0.0
+        self._last_pct = -1
+        self._last_emit = 0.0
+
+        # The flasher outlives the thread, so route its callbacks to this one
+        flasher.status_callback = self.show_status
+        flasher.log_callback = self.log_debug
+        flasher.progress_callback = self.update_progress
 
     def update_progress(self, value):
-        self.progress_signal.emit(value)
+        pct = int(value)
+        now = time.monotonic()
+        # Always deliver 100, the GUI relies on it to re-enable the buttons
+        if pct == 100 or (pct != self._last_pct and now - self._last_emit > self.PROGRESS_INTERVAL):
+            self._last_pct = pct
+            self._last_emit = now
+            self.flush()
+            self.progress_signal.emit(pct)
 
     def log_debug(self, message):
-        self.debug_signal.emit(message)
+        self._log_buf.append(message)
+        if (len(self._log_buf) >= self.LOG_BATCH_LINES
+                or time.monotonic() - self._log_last > self.LOG_BATCH_INTERVAL):
+            self.flush()
 
     def show_status(self, message):
+        # Keep status messages in order with the buffered log lines
+        self.flush()
         self.status_signal.emit(message)
 
+    def show_exception(self, error):
+        # The log lines leading up to the error go out before the error box
+        self.flush()
+        self.exception_signal.emit(error)
+
+    def flush(self):
+        """Send all buffered log lines to the GUI as one message"""
+        if self._log_buf:
+            self.debug_signal.emit('\n'.join(self._log_buf))
+            self._log_buf.clear()
+        self._log_last = time.monotonic()
+
 
 class FirmwareUpdateThread(BaseThread):
-    def __init__(self, com_port, firmware_file, simulation, debug, firmware_type=None, parent=None):
-        super().__init__(com_port, firmware_file, simulation, debug, firmware_type, parent)
+    def __init__(self, flasher, firmware_file, parent=None):
+        super().__init__(flasher, firmware_file, parent)
 
     def run(self):
         try:
-            # Auto-detect firmware type if not specified
-            if self.firmware_type is None:
-                self.firmware_type = detect_firmware_file(self.firmware_file)
-
-            # Create appropriate flasher
-            updater = create_flasher_for_firmware(
-                self.firmware_file,
-                tty_port=self.com_port,
-                simulation=self.simulation,
-                debug=self.debug,
-                status_callback=self.show_status,
-                log_callback=self.log_debug,
-                progress_callback=self.update_progress,
-            )
-            updater.load_file(self.firmware_file)
-            updater.run()
+            self.flasher.load_file(self.firmware_file)
+            self.flasher.run()
         except FlasherException as e:
-            self.exception_signal.emit(["Flasher", str(e)])
+            self.show_exception(["Flasher", str(e)])
         except SerialException:
-            self.exception_signal.emit(["Serial", "The serial connection caused an error. Is your adapter connected?"])
+            self.show_exception(["Serial", "The serial connection caused an error. Is your adapter connected?"])
         except Exception as e:
-            self.exception_signal.emit(["Unknown", str(e)])
+            self.show_exception(["Unknown", str(e)])
+        finally:
+            self.flush()
 
 
 class TestConnectionThread(BaseThread):
-    def __init__(self, com_port, firmware_file, simulation, debug, firmware_type=None, parent=None):
-        super().__init__(com_port, firmware_file, simulation, debug, firmware_type, parent)
+    def __init__(self, flasher, firmware_file, parent=None):
+        super().__init__(flasher, firmware_file, parent)
 
     def run(self):
         try:
-            # Auto-detect firmware type if firmware file is provided
-            if self.firmware_file and self.firmware_type is None:
-                self.firmware_type = detect_firmware_file(self.firmware_file)
-
-            # Create appropriate flasher or default to Brightway
-            if self.firmware_file:
-                updater = create_flasher_for_firmware(
-                    self.firmware_file,
-                    tty_port=self.com_port,
-                    simulation=self.simulation,
-                    debug=self.debug,
-                    status_callback=self.show_status,
-                    log_callback=self.log_debug,
-                    progress_callback=self.update_progress,
-                )
-            else:
-                # No firmware file - use default Brightway flasher
-                updater = DFU(
-                    tty_port=self.com_port,
-                    simulation=self.simulation,
-                    debug=self.debug,
-                    status_callback=self.show_status,
-                    log_callback=self.log_debug,
-                    progress_callback=self.update_progress,
-                )
-            updater.test_connection()
+            self.flasher.test_connection()
         except SerialException:
-            self.exception_signal.emit(["Serial", "The serial connection caused an error. Is your adapter connected?"])
+            self.show_exception(["Serial", "The serial connection caused an error. Is your adapter connected?"])
         except Exception as e:
-            self.exception_signal.emit(["Unknown", str(e)])
+            self.show_exception(["Unknown", str(e)])
+        finally:
+            self.flush()
+
+
+class PortScanThread(QThread):
+    ports_ready = Signal(list)
+
+    def __init__(self, force=False, parent=None):
+        super().__init__(parent)
+        self.force = force
+
+    def run(self):
+        self.ports_ready.emit(get_serial_ports(force=self.force))
+
+
+class UpdateChecker(QObject):
+    """Check for program updates on a daemon thread, results arrive as signals"""
+    update_available = Signal(dict)
+    update_error = Signal(str)
+
+    def __init__(self, cache_file):
+        super().__init__()
+        self.cache_file = cache_file
+
+    def start(self):
+        # Unlike a QThread, a daemon thread can be left behind when the window
+        # closes, so a slow network never holds up closing and exiting
+        threading.Thread(target=self.run, name="UpdateCheck", daemon=True).start()
+
+    def run(self):
+        # Imported here, off the GUI thread, to keep it out of startup
+        import requests
+
+        try:
+            update_details = check_update(self.cache_file)
+        except requests.exceptions.Timeout:
+            # A slow network is not worth interrupting the user for
+            return
+        except requests.exceptions.RequestException as e:
+            self.update_error.emit(str(e))
+            return
+
+        if update_details:
+            self.update_available.emit(update_details)
 
 
 class CRTScanlineWidget(QWidget):
     """CRT scanline overlay effect"""
+    ACTIVE_INTERVAL = 16  # ~60fps
+    INACTIVE_INTERVAL = 33  # ~30fps while the window is in the background
+
+    SCANLINE_COLOR = QColor(0, 0, 0, 30)
+    VIGNETTE_CLEAR = QColor(0, 0, 0, 0)
+    VIGNETTE_EDGE = QColor(0, 0, 0, 120)
+    BAND_CLEAR = QColor(255, 255, 255, 0)
+    BAND_GLOW = QColor(150, 255, 255, 40)
+    BAND_HEIGHT = 40
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
-        # Scanline animation
+        # Scanline animation, runs only while the widget is shown
         self.scanline_pos = 0
+        self._static_layer = QPixmap()
+
+        # One dark row followed by two transparent rows, tiled by the painter
+        pattern = QImage(1, 3, QImage.Format_ARGB32)
+        pattern.fill(Qt.transparent)
+        pattern.setPixelColor(0, 0, self.SCANLINE_COLOR)
+        self._scanline_brush = QBrush(pattern)
+
+        # The moving band always looks the same, it is only painted at an offset
+        self._band = QLinearGradient(0, 0, 0, self.BAND_HEIGHT)
+        self._band.setColorAt(0, self.BAND_CLEAR)
+        self._band.setColorAt(0.5, self.BAND_GLOW)
+        self._band.setColorAt(1, self.BAND_CLEAR)
+
+        self.frame_interval = self.ACTIVE_INTERVAL
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_scanline)
-        self.timer.start(16)  # ~60fps
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.resume()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.pause()
+
+    def pause(self):
+        """Stop the animation while nobody can see it"""
+        self.timer.stop()
+
+    def resume(self):
+        """Restart the animation if the overlay is actually visible"""
+        if self.isVisible() and not self.window().isMinimized():
+            self.timer.start(self.frame_interval)
+
+    def set_frame_interval(self, interval):
+        """Change the animation rate without restarting a paused animation"""
+        self.frame_interval = interval
+        if self.timer.isActive():
+            self.timer.start(interval)
 
     def update_scanline(self):
         """Update scanline position"""
-        self.scanline_pos = (self.scanline_pos + 2) % self.height() if self.height() > 0 else 0
-        self.update()
+        height = self.height()
+        if height <= 0:
+            self.scanline_pos = 0
+            return
 
-    def paintEvent(self, event):
-        """Paint CRT scanline effect"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        prev_pos = self.scanline_pos
+        self.scanline_pos = (self.scanline_pos + 2) % height
+        if self.scanline_pos < prev_pos:
+            # Wrapped around, the band at the bottom has to be cleared too
+            self.update()
+        else:
+            # Only the moving band changes, covering both its old and new position
+            self.update(0, self.scanline_pos - 22, self.width(), 44)
 
-        # Draw horizontal scanlines
-        for y in range(0, self.height(), 3):
-            painter.setPen(QColor(0, 0, 0, 30))
-            painter.drawLine(0, y, self.width(), y)
+    def resizeEvent(self, event):
+        """Re-render the static part of the effect for the new size"""
+        super().resizeEvent(event)
+        self.render_static_layer()
 
-        # Draw moving bright scanline
-        gradient = QLinearGradient(0, self.scanline_pos - 20, 0, self.scanline_pos + 20)
-        gradient.setColorAt(0, QColor(255, 255, 255, 0))
-        gradient.setColorAt(0.5, QColor(150, 255, 255, 40))
-        gradient.setColorAt(1, QColor(255, 255, 255, 0))
+    def render_static_layer(self):
+        """Render scanlines and vignette, which only depend on the widget size"""
+        ratio = self.devicePixelRatioF()
+        self._static_layer = QPixmap(self.size() * ratio)
+        self._static_layer.setDevicePixelRatio(ratio)
+        self._static_layer.fill(Qt.transparent)
 
-        painter.fillRect(0, self.scanline_pos - 20, self.width(), 40, gradient)
+        painter = QPainter(self._static_layer)
+
+        # Draw horizontal scanlines, every third row
+        painter.fillRect(self.rect(), self._scanline_brush)
 
         # Add vignette effect
         center_x = self.width() / 2
@@ -197,21 +402,53 @@ class CRTScanlineWidget(QWidget):
         radius = max(self.width(), self.height())
 
         vignette = QRadialGradient(center_x, center_y, radius)
-        vignette.setColorAt(0, QColor(0, 0, 0, 0))
-        vignette.setColorAt(0.7, QColor(0, 0, 0, 0))
-        vignette.setColorAt(1, QColor(0, 0, 0, 120))
+        vignette.setColorAt(0, self.VIGNETTE_CLEAR)
+        vignette.setColorAt(0.7, self.VIGNETTE_CLEAR)
+        vignette.setColorAt(1, self.VIGNETTE_EDGE)
 
         painter.fillRect(self.rect(), vignette)
+        painter.end()
+
+    def paintEvent(self, event):
+        """Paint CRT scanline effect"""
+        painter = QPainter(self)
+
+        # Static scanlines and vignette
+        painter.drawPixmap(0, 0, self._static_layer)
+
+        # Draw moving bright scanline
+        painter.translate(0, self.scanline_pos - self.BAND_HEIGHT // 2)
+        painter.fillRect(0, 0, self.width(), self.BAND_HEIGHT, self._band)
 
 
 class FirmwareUpdateGUI(QWidget):
+    # Knight Rider bar as (offset from the head, char), solid to transparent,
+    # with the tail trailing behind the direction of travel
+    _BAR_CHARS = ('█', '▓', '▒', '░', ' ')
+    _BAR_RIGHT = tuple((-i, char) for i, char in enumerate(_BAR_CHARS))
+    _BAR_LEFT = tuple((i, char) for i, char in enumerate(_BAR_CHARS))
+
     def __init__(self):
         super().__init__()
 
         self.update_thread = None
+        self.update_checker = None
+        self.port_scan_thread = None
+        self._port_rescan = False
+        self.flasher = None
+        self.flasher_key = None
         self.flasher_debug = False
         self.window_name = get_name()
 
+        # Firmware detection reads the whole file, so only run it once the
+        # path stops changing and remember the result for the current file
+        # version, older selections are not needed again
+        self._pending_fw_path = None
+        self._fw_cache = {}
+        self._fw_detect_timer = QTimer(self)
+        self._fw_detect_timer.setSingleShot(True)
+        self._fw_detect_timer.timeout.connect(self._do_detect)
+
         self.setWindowTitle(self.window_name)
         self.setWindowIcon(QIcon(resource_path("app.ico")))
 
@@ -219,9 +456,7 @@ class FirmwareUpdateGUI(QWidget):
         self.setObjectName("mainWindow")
 
         # Set the modern dark theme stylesheet
-        self.setStyleSheet(DARK_THEME_STYLESHEET)
-        self.check_update()
-        self.disclaimer_messagebox()
+        self.setStyleSheet(get_dark_theme_stylesheet())
 
         self.setGeometry(100, 100, 600, 500)
         layout = QVBoxLayout()
@@ -233,16 +468,43 @@ class FirmwareUpdateGUI(QWidget):
         self.crt_scanlines.setGeometry(self.rect())
         self.crt_scanlines.raise_()
 
-        # Create banner text programmatically
+        # Create banner text programmatically. It is shown in a read-only text
+        # view so the animation can swap single characters, which a QLabel
+        # would re-layout completely
         self.heading_text = self.create_banner_text()
-        self.heading_label = QLabel(self.heading_text, self)
-        self.heading_label.setAlignment(Qt.AlignCenter)
-        self.heading_label.setObjectName("titleLabel")
+        self.heading_view = QPlainTextEdit(self)
+        self.heading_view.setObjectName("titleLabel")
+        self.heading_view.setReadOnly(True)
+        self.heading_view.setUndoRedoEnabled(False)
+        self.heading_view.setTextInteractionFlags(Qt.NoTextInteraction)
+        self.heading_view.setFocusPolicy(Qt.NoFocus)
+        self.heading_view.setFrameStyle(QFrame.NoFrame)
+        self.heading_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.heading_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.heading_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        centered = QTextOption(Qt.AlignHCenter)
+        centered.setWrapMode(QTextOption.NoWrap)
+        self.heading_view.document().setDefaultTextOption(centered)
+        self.heading_view.document().setDocumentMargin(0)
         # Set monospace font for proper ASCII art alignment
         monospace_font = QFont("monospace", 10)
         monospace_font.setStyleHint(QFont.Monospace)
-        self.heading_label.setFont(monospace_font)
-        layout.addWidget(self.heading_label)
+        self.heading_view.setFont(monospace_font)
+        self.heading_view.setPlainText(self.heading_text)
+
+        # Size it like a label would be, exactly fitting the banner
+        self.heading_view.ensurePolished()
+        margins = self.heading_view.contentsMargins()
+        metrics = self.heading_view.fontMetrics()
+        banner_lines = self.heading_text.split('\n')
+        self.heading_view.setFixedHeight(
+            metrics.lineSpacing() * len(banner_lines) + margins.top() + margins.bottom()
+        )
+        self.heading_view.setMinimumWidth(
+            max(metrics.horizontalAdvance(line) for line in banner_lines) + margins.left() + margins.right()
+        )
+        self.heading_view.viewport().setCursor(Qt.ArrowCursor)
+        layout.addWidget(self.heading_view)
 
         # Serial port selection
         layout_h = QHBoxLayout()
@@ -252,7 +514,6 @@ class FirmwareUpdateGUI(QWidget):
         layout_h.addWidget(self.com_label)
         self.com_port = QComboBox()
         self.com_port.setEditable(True)
-        self.com_port.addItems(get_serial_ports())
         self.com_port.setObjectName("serialCombo")
         layout_h.addWidget(self.com_port, 1)
         self.refresh_button = QPushButton("🔄 Refresh")
@@ -262,6 +523,10 @@ class FirmwareUpdateGUI(QWidget):
         layout_h.addWidget(self.refresh_button)
         layout.addLayout(layout_h)
 
+        # Rescan the ports by itself when an adapter comes or goes
+        self.serial_hotplug = SerialHotplug(self)
+        self.serial_hotplug.ports_changed.connect(self.refresh_serial_ports)
+
         # Firmware file selection
         layout_h = QHBoxLayout()
         layout_h.setSpacing(8)
@@ -283,15 +548,6 @@ class FirmwareUpdateGUI(QWidget):
         # Firmware type label
         self.firmware_type_label = QLabel("Firmware Type: Unknown")
         self.firmware_type_label.setObjectName("firmwareTypeLabel")
-        self.firmware_type_label.setStyleSheet("""
-            QLabel#firmwareTypeLabel {
-                background-color: #2b2b2b;
-                padding: 8px 12px;
-                border-radius: 4px;
-                font-weight: bold;
-                border: 1px solid #3a3a3a;
-            }
-        """)
         layout.addWidget(self.firmware_type_label)
 
         # Mode selection
@@ -329,7 +585,17 @@ class FirmwareUpdateGUI(QWidget):
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setObjectName("logOutput")
+        # Drop the oldest lines so appending stays cheap during long debug sessions
+        self.log_output.setUndoRedoEnabled(False)
+        self.log_output.document().setMaximumBlockCount(2000)
         layout.addWidget(self.log_output)
+        # Lines are collected here and written in one go, so a burst of
+        # messages costs a single relayout instead of one per line
+        self._log_buf = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
 
         self.status_bar = QStatusBar(self)
         layout.addWidget(self.status_bar)
@@ -342,8 +608,75 @@ class FirmwareUpdateGUI(QWidget):
         # Set up banner animation
         self.setup_banner_animation()
 
-        # Set up the media player and play chiptune
-        self.setup_music()
+        # Set up the media player and play chiptune once the window is up,
+        # loading the multimedia backend is slow
+        QTimer.singleShot(0, self.setup_music)
+
+        # Fill in the serial ports without holding up the window
+        self.start_port_scan()
+
+        # Ask for the disclaimer once the window is up
+        QTimer.singleShot(0, self.disclaimer_dialog)
+
+    def closeEvent(self, event):
+        """Stop a running operation and release the serial port when the window is closed"""
+        if self.update_thread is not None and self.update_thread.isRunning():
+            # Nobody is left to show the results, just let the thread wind down
+            self.update_thread.blockSignals(True)
+            self.update_thread.flasher.cancel()
+            self.update_thread.wait()
+        if self.update_checker is not None:
+            # Nobody is waiting for the answer any more, don't wait for it either
+            self.update_checker.blockSignals(True)
+        if self.port_scan_thread is not None and self.port_scan_thread.isRunning():
+            self.port_scan_thread.blockSignals(True)
+            self.port_scan_thread.wait()
+        self.serial_hotplug.stop()
+        self.close_flasher()
+        super().closeEvent(event)
+
+    def changeEvent(self, event):
+        """Throttle effect animations while the window is minimized or inactive"""
+        super().changeEvent(event)
+        if not hasattr(self, 'crt_scanlines'):
+            return
+
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.pause_effects()
+            else:
+                self.resume_effects()
+        elif event.type() == QEvent.ActivationChange:
+            if self.isActiveWindow():
+                self.crt_scanlines.set_frame_interval(CRTScanlineWidget.ACTIVE_INTERVAL)
+            else:
+                self.crt_scanlines.set_frame_interval(CRTScanlineWidget.INACTIVE_INTERVAL)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.pause_effects()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.isMinimized():
+            self.resume_effects()
+
+    def pause_effects(self):
+        """Stop animations and music while the window can't be seen"""
+        self.crt_scanlines.pause()
+        self.animation_timer.stop()
+        player = getattr(self, 'player', None)
+        if player is not None and player.playbackState() == player.PlaybackState.PlayingState:
+            player.pause()
+
+    def resume_effects(self):
+        """Pick animations and music back up after pause_effects()"""
+        self.crt_scanlines.resume()
+        if not self.animation_timer.isActive():
+            self.animation_timer.start(self.animation_speed)
+        player = getattr(self, 'player', None)
+        if player is not None and player.playbackState() == player.PlaybackState.PausedState:
+            player.play()
 
     def resizeEvent(self, event):
         """Handle window resize to update effect overlays"""
@@ -392,76 +725,109 @@ class FirmwareUpdateGUI(QWidget):
 
     def setup_banner_animation(self):
         """Set up Knight Rider-style banner animation"""
-        # Animation state
-        self.animation_position = 0
-        self.animation_direction = 1  # 1 for right, -1 for left
         self.animation_speed = 100  # milliseconds between updates
-        
+
+        # Render all frames up front, the timer only has to swap them in
+        self._precompute_banner_frames()
+        self._frame_idx = 0
+        self._banner_cursor = QTextCursor(self.heading_view.document())
+        self._shown_line = self._anim_original
+        self._line_start = self.heading_view.document().findBlockByNumber(1).position()
+
         # Create timer for animation
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self.update_banner_animation)
         self.animation_timer.start(self.animation_speed)
-        
+
         # Initial animation update
         self.update_banner_animation()
 
+    def _precompute_banner_frames(self):
+        """Build the complete Knight Rider-style animation cycle"""
+        # Only the second line moves, the rest is the same in every frame
+        lines = self.create_banner_text().split('\n')
+
+        # The animated line is edited in place, undoing the previous bar each frame
+        self._anim_original = lines[1]
+        self._anim_line = list(lines[1])
+        self._anim_changed = []
+
+        banner_width = len(lines[1])
+        position = 0
+        direction = 1  # 1 for right, -1 for left
+
+        # One full sweep right and back left, after which the cycle repeats.
+        # Frames hold just the animated line
+        frames = []
+        for _ in range(2 * (banner_width - 1)):
+            position += direction
+
+            # Reverse direction at edges
+            if position >= banner_width - 1:
+                direction = -1
+            elif position <= 0:
+                direction = 1
+
+            frames.append(self.create_animated_line(position, direction))
+
+        self._frames = tuple(frames)
+        self._frame_count = len(self._frames)
+
     def update_banner_animation(self):
         """Update the Knight Rider-style animation"""
-        # Get the base banner text
-        base_text = self.create_banner_text()
-        lines = base_text.split('\n')
-        
-        # Animation bar characters (Knight Rider style)
-        bar_chars = ['█', '▓', '▒', '░', ' ']  # Solid to transparent
-        
-        # Calculate animation position (0 to banner width)
-        banner_width = 58
-        self.animation_position += self.animation_direction
-        
-        # Reverse direction at edges
-        if self.animation_position >= banner_width - 1:
-            self.animation_direction = -1
-        elif self.animation_position <= 0:
-            self.animation_direction = 1
-        
-        # Create animated banner
-        animated_lines = []
-        for i, line in enumerate(lines):
-            if i == 1:  # Title line - add animation bar
-                animated_line = self.create_animated_line(line, self.animation_position, bar_chars)
-                animated_lines.append(animated_line)
-            else:
-                animated_lines.append(line)
-        
-        # Update the banner text
-        self.heading_label.setText('\n'.join(animated_lines))
-
-    def create_animated_line(self, base_line, position, bar_chars):
+        line = self._frames[self._frame_idx]
+        shown = self._shown_line
+        # Only replace the few characters the bar moved over. While it passes
+        # behind the text, consecutive frames are identical and nothing changes
+        if line != shown:
+            cursor = self._banner_cursor
+            cursor.beginEditBlock()
+            for pos, char in enumerate(line):
+                if char != shown[pos]:
+                    cursor.setPosition(self._line_start + pos)
+                    cursor.movePosition(QTextCursor.NextCharacter, QTextCursor.KeepAnchor)
+                    cursor.insertText(char)
+            cursor.endEditBlock()
+            self._shown_line = line
+        self._frame_idx = (self._frame_idx + 1) % self._frame_count
+
+    def create_animated_line(self, position, direction):
         """Create a line with Knight Rider-style animation bar"""
-        # Convert line to list for manipulation
-        line_chars = list(base_line)
-        
+        line_chars = self._anim_line
+        original = self._anim_original
+        width = len(line_chars)
+
+        # Remove the bar of the previous frame
+        for pos in self._anim_changed:
+            line_chars[pos] = original[pos]
+        self._anim_changed.clear()
+
         # Add animation bar at the current position
-        if 0 <= position < len(line_chars):
-            # Create gradient effect based on direction
-            for i, char in enumerate(bar_chars):
-                if self.animation_direction > 0:
-                    pos = position - i  # Moving right, tail is to the left
-                else:
-                    pos = position + i  # Moving left, tail is to the right
-
-                if 0 <= pos < len(line_chars) and line_chars[pos] == ' ':
+        if 0 <= position < width:
+            for offset, char in self._BAR_RIGHT if direction > 0 else self._BAR_LEFT:
+                pos = position + offset
+                if 0 <= pos < width and original[pos] == ' ':
                     line_chars[pos] = char
-        
+                    self._anim_changed.append(pos)
+
         return ''.join(line_chars)
 
     def setup_music(self):
-        """Set up and play the chiptune music"""
+        """Set up and play the chiptune music, unless BWFLASHER_NOSOUND is set"""
+        if os.environ.get("BWFLASHER_NOSOUND"):
+            return
+
         try:
+            # QtMultimedia loads the platform media backend, so it is only
+            # imported once the window is up
+            from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+
             # Set up the media player
             self.player = QMediaPlayer()
             self.audio_output = QAudioOutput()
+            self.audio_output.setVolume(0.5)
             self.player.setAudioOutput(self.audio_output)
+            self.player.setLoops(QMediaPlayer.Loops.Infinite)
 
             # Set the file path for the tune
             file_url = QUrl.fromLocalFile(resource_path("chiptune.mp3"))
@@ -490,6 +856,8 @@ class FirmwareUpdateGUI(QWidget):
         )
         if file:
             self.file_path.setText(file)
+            # Explicit selection, no need to wait for the debounce
+            self._fw_detect_timer.stop()
             self.update_firmware_type_label(file)
 
     def on_firmware_file_changed(self, file_path):
@@ -501,112 +869,144 @@ class FirmwareUpdateGUI(QWidget):
         self.start_button.setEnabled(is_valid)
 
         if is_valid:
-            self.update_firmware_type_label(file_path)
+            self._pending_fw_path = file_path
+            self._fw_detect_timer.start(300)
         else:
-            self.firmware_type_label.setText("Firmware Type: Unknown")
-            self.firmware_type_label.setStyleSheet("""
-                QLabel#firmwareTypeLabel {
-                    background-color: #2b2b2b;
-                    padding: 8px 12px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    border: 1px solid #3a3a3a;
-                    color: #999999;
-                }
-            """)
+            self._fw_detect_timer.stop()
+            self.set_firmware_type("Firmware Type: Unknown", "unknown")
+
+    def _do_detect(self):
+        """Run the debounced firmware detection"""
+        file_path = self._pending_fw_path
+        if file_path and os.path.exists(file_path):
+            self.update_firmware_type_label(file_path)
+
+    def get_cached_firmware_info(self, file_path):
+        """Get firmware info, only reading the file if it changed since last time"""
+        stat = os.stat(file_path)
+        cache_key = (file_path, stat.st_mtime, stat.st_size)
+
+        fw_info = self._fw_cache.get(cache_key)
+        if fw_info is None:
+            with open(file_path, 'rb') as f:
+                header = f.read(FIRMWARE_HEADER_SIZE)
+                fw_info = get_firmware_info_header(header, stat.st_size)
+                if fw_info[0] == FirmwareType.UNKNOWN:
+                    # Not conclusive from the header alone, analyse the whole file
+                    fw_info = get_firmware_info(header + f.read())
+            self._fw_cache = {cache_key: fw_info}
+        return fw_info
+
+    def set_firmware_type(self, text, state):
+        """Show a detection result, the look per state lives in the theme"""
+        self.firmware_type_label.setText(text)
+        if self.firmware_type_label.property("fwState") != state:
+            self.firmware_type_label.setProperty("fwState", state)
+            style = self.firmware_type_label.style()
+            style.unpolish(self.firmware_type_label)
+            style.polish(self.firmware_type_label)
 
     def update_firmware_type_label(self, file_path):
         """Update the firmware type label based on detected firmware type"""
         try:
-            fw_type, fw_info = get_firmware_info(open(file_path, 'rb').read())
+            fw_type, fw_info = self.get_cached_firmware_info(file_path)
 
             if fw_type == FirmwareType.BRIGHTWAY:
-                self.firmware_type_label.setText(f"Firmware Type: Brightway (ARM Cortex-M)")
-                self.firmware_type_label.setStyleSheet("""
-                    QLabel#firmwareTypeLabel {
-                        background-color: #1e3a1e;
-                        padding: 8px 12px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                        border: 1px solid #2d5a2d;
-                        color: #66ff66;
-                    }
-                """)
+                self.set_firmware_type("Firmware Type: Brightway (ARM Cortex-M)", "ok")
             elif fw_type == FirmwareType.LEQI:
-                self.firmware_type_label.setText(f"Firmware Type: LEQI (Encrypted)")
-                self.firmware_type_label.setStyleSheet("""
-                    QLabel#firmwareTypeLabel {
-                        background-color: #1e3a1e;
-                        padding: 8px 12px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                        border: 1px solid #2d5a2d;
-                        color: #66ff66;
-                    }
-                """)
+                self.set_firmware_type("Firmware Type: LEQI (Encrypted)", "ok")
             elif fw_type == FirmwareType.NINEBOT:
-                self.firmware_type_label.setText(f"Firmware Type: Ninebot (v{fw_info['version']})")
-                self.firmware_type_label.setStyleSheet("""
-                    QLabel#firmwareTypeLabel {
-                        background-color: #1e3a1e;
-                        padding: 8px 12px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                        border: 1px solid #2d5a2d;
-                        color: #66ff66;
-                    }
-                """
-            )
+                self.set_firmware_type(f"Firmware Type: Ninebot (v{fw_info['version']})", "ok")
             else:
-                self.firmware_type_label.setText("Firmware Type: Unknown")
-                self.firmware_type_label.setStyleSheet("""
-                    QLabel#firmwareTypeLabel {
-                        background-color: #2b2b2b;
-                        padding: 8px 12px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                        border: 1px solid #3a3a3a;
-                        color: #999999;
-                    }
-                """)
+                self.set_firmware_type("Firmware Type: Unknown", "unknown")
         except Exception as e:
-            self.firmware_type_label.setText(f"Firmware Type: Error ({str(e)})")
-            self.firmware_type_label.setStyleSheet("""
-                QLabel#firmwareTypeLabel {
-                    background-color: #3a3a1e;
-                    padding: 8px 12px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    border: 1px solid #5a5a2d;
-                    color: #ffff66;
-                }
-            """)
+            self.set_firmware_type(f"Firmware Type: Error ({str(e)})", "error")
 
     def refresh_serial_ports(self):
         """Refresh the list of available serial ports"""
-        # Store current selection
-        current_port = self.com_port.currentText()
-
-        # Clear and repopulate
-        self.com_port.clear()
-        ports = get_serial_ports()
-        self.com_port.addItems(ports)
+        # Asked for explicitly or a device came or went, so always rescan
+        self.start_port_scan(force=True)
+
+    def start_port_scan(self, force=False):
+        """Enumerate the serial ports in the background, results go to update_serial_ports"""
+        if self.port_scan_thread is not None and self.port_scan_thread.isRunning():
+            # The running scan may predate the change, look again once it is done
+            self._port_rescan = True
+            return
 
-        # Restore previous selection if still available
-        if current_port and current_port in ports:
-            self.com_port.setCurrentText(current_port)
+        self.port_scan_thread = PortScanThread(force, self)
+        self.port_scan_thread.ports_ready.connect(self.update_serial_ports)
+        self.port_scan_thread.finished.connect(self._port_scan_finished)
+        # A scan runs on every refresh and hotplug event, don't keep them around
+        self.port_scan_thread.finished.connect(self.port_scan_thread.deleteLater)
+        self.port_scan_thread.start()
+
+    def _port_scan_finished(self):
+        self.port_scan_thread = None
+        if self._port_rescan:
+            self._port_rescan = False
+            self.start_port_scan(force=True)
+
+    def update_serial_ports(self, ports):
+        """Show a new port list in the combobox"""
+        listed = [self.com_port.itemText(i) for i in range(self.com_port.count())]
+
+        # Only touch the combobox when the port list actually changed, so the
+        # typed text and selection survive a refresh
+        if ports != listed:
+            current_port = self.com_port.currentText()
+            self.com_port.blockSignals(True)
+
+            # Scans don't return the ports in a stable order, so rebuild the
+            # list rather than patching it position by position
+            self.com_port.clear()
+            self.com_port.addItems(ports)
+
+            # Keep the previous text unless it was a port that disappeared
+            index = self.com_port.findText(current_port)
+            if index >= 0:
+                self.com_port.setCurrentIndex(index)
+            elif current_port in listed:
+                self.com_port.setCurrentIndex(0 if ports else -1)
+            elif current_port:
+                self.com_port.setEditText(current_port)
+
+            self.com_port.blockSignals(False)
 
         # Show status message
         self.status_bar.showMessage(f"Found {len(ports)} serial port(s)", 2000)
 
-    def test_connection(self):
-        simulation = self.simulation_checkbox.isChecked()
-        self.flasher_debug = self.debug_checkbox.isChecked()
-        com_port = self.com_port.currentText()
-        firmware_file = self.file_path.text()
+    def get_flasher(self, com_port, firmware_file, simulation, debug):
+        """Return a flasher for the given settings, reusing the open port if possible"""
+        if firmware_file:
+            # The firmware type label already detected this file, reuse that
+            # instead of analysing the whole image again on the GUI thread
+            fw_type, _ = self.get_cached_firmware_info(firmware_file)
+            flasher_class = get_flasher_class_for_type(fw_type)
+        else:
+            flasher_class = DFU
+        flasher_key = (flasher_class, com_port, simulation, debug)
+
+        if self.flasher is None or self.flasher_key != flasher_key:
+            self.close_flasher()
+            self.flasher = flasher_class(
+                tty_port=com_port,
+                simulation=simulation,
+                debug=debug,
+            )
+            self.flasher_key = flasher_key
+
+        return self.flasher
 
-        self.update_thread = TestConnectionThread(com_port, firmware_file, simulation, self.flasher_debug)
-        self.start_thread()
+    def close_flasher(self):
+        """Close the cached flasher and its serial port"""
+        if self.flasher is not None:
+            self.flasher.close()
+        self.flasher = None
+        self.flasher_key = None
+
+    def test_connection(self):
+        self.start_thread(TestConnectionThread, self.file_path.text())
 
     def start_update(self):
         firmware_file = self.file_path.text()
@@ -614,18 +1014,28 @@ class FirmwareUpdateGUI(QWidget):
             self.update_status("Please select a firmware file!")
             return
 
+        self.start_thread(FirmwareUpdateThread, firmware_file)
+
+    def start_thread(self, thread_class, firmware_file):
         simulation = self.simulation_checkbox.isChecked()
         self.flasher_debug = self.debug_checkbox.isChecked()
         com_port = self.com_port.currentText()
 
-        self.update_thread = FirmwareUpdateThread(com_port, firmware_file, simulation, self.flasher_debug)
-        self.start_thread()
+        try:
+            flasher = self.get_flasher(com_port, firmware_file, simulation, self.flasher_debug)
+        except SerialException:
+            self.exception_messagebox(["Serial", "The serial connection caused an error. Is your adapter connected?"])
+            return
+        except Exception as e:
+            self.exception_messagebox(["Unknown", str(e)])
+            return
 
-    def start_thread(self):
+        self.update_thread = thread_class(flasher, firmware_file)
         self.update_thread.progress_signal.connect(self.update_progress)
         self.update_thread.debug_signal.connect(self.debug_log)
         self.update_thread.status_signal.connect(self.update_status)
         self.update_thread.exception_signal.connect(self.exception_messagebox)
+        self._log_buf.clear()
         self.log_output.clear()
         self.update_thread.start()
 
@@ -642,27 +1052,69 @@ class FirmwareUpdateGUI(QWidget):
         if self.flasher_debug:
             self.status_bar.showMessage(message, 2000)
         else:
-            self.log_output.append(message)
+            self._queue_log(message)
 
     def debug_log(self, message):
-        self.log_output.append(message)
+        self._queue_log(message)
+
+    def _queue_log(self, message):
+        self._log_buf.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        text = '\n'.join(self._log_buf)
+        self._log_buf.clear()
+
+        document = self.log_output.document()
+        if not document.isEmpty():
+            text = '\n' + text
+        scrollbar = self.log_output.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        self.log_output.setUpdatesEnabled(False)
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.log_output.setUpdatesEnabled(True)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def exception_messagebox(self, thread_signal: list):
         error_type = thread_signal[0]
         message = thread_signal[1]
+        # Show the log lines explaining the error before the dialog blocks
+        self._flush_log()
 
         error_dialog = QMessageBox(self)
         error_dialog.setIcon(QMessageBox.Critical)
         error_dialog.setWindowTitle(f"{self.window_name} - {error_type} Error")
         error_dialog.setText(message)
         error_dialog.exec()
+
+        # The port may be unusable after an error, reopen it next time
+        self.close_flasher()
         self.test_button.setEnabled(True)
         self.start_button.setEnabled(True)
 
-    def disclaimer_messagebox(self):
-        messagebox = QMessageBox(self)
-        messagebox.setIcon(QMessageBox.Warning)
-        messagebox.setWindowTitle(f"{self.window_name} - Important Legal Notice")
+    def disclaimer_dialog(self):
+        """Show the legal notice until it has been accepted once, then look for updates"""
+        settings = QSettings("ScooterTeam", "bwflasher")
+        if not settings.value("disclaimer_accepted_v1", False, type=bool):
+            if self.build_disclaimer_dialog().exec() != QDialog.Accepted:
+                self.close()
+                return
+            settings.setValue("disclaimer_accepted_v1", True)
+
+        self.check_update()
+
+    def build_disclaimer_dialog(self):
+        dialog = QDialog(self)
+        dialog.setObjectName("disclaimerDialog")
+        dialog.setWindowTitle(f"{self.window_name} - Important Legal Notice")
 
         disclaimer_text = """<h3>⚠️ IMPORTANT: Read Before Using</h3>
 
@@ -689,35 +1141,51 @@ By clicking 'Accept', you acknowledge these risks and agree to use responsibly.
 </p>
 """
 
-        messagebox.setText(disclaimer_text)
-        messagebox.setStandardButtons(QMessageBox.Ok | QMessageBox.Cancel)
-        messagebox.setDefaultButton(QMessageBox.Cancel)
+        icon_label = QLabel()
+        icon_label.setPixmap(self.style().standardIcon(QStyle.SP_MessageBoxWarning).pixmap(48, 48))
+        icon_label.setAlignment(Qt.AlignTop)
 
-        ok_button = messagebox.button(QMessageBox.Ok)
-        ok_button.setText("Accept")
+        text_label = QLabel()
+        text_label.setTextFormat(Qt.RichText)
+        text_label.setWordWrap(True)
+        text_label.setMinimumWidth(480)
+        text_label.setText(disclaimer_text)
 
-        cancel_button = messagebox.button(QMessageBox.Cancel)
-        cancel_button.setText("Exit")
+        button_box = QDialogButtonBox()
+        accept_button = button_box.addButton("Accept", QDialogButtonBox.AcceptRole)
+        exit_button = button_box.addButton("Exit", QDialogButtonBox.RejectRole)
+        accept_button.setAutoDefault(False)
+        exit_button.setDefault(True)
+        button_box.accepted.connect(dialog.accept)
+        button_box.rejected.connect(dialog.reject)
 
-        result = messagebox.exec()
+        layout_h = QHBoxLayout()
+        layout_h.addWidget(icon_label)
+        layout_h.addWidget(text_label, 1)
+        layout = QVBoxLayout(dialog)
+        layout.addLayout(layout_h)
+        layout.addWidget(button_box)
 
-        if result == QMessageBox.Cancel:
-            sys.exit(0)
+        return dialog
 
     def check_update(self):
-        try:
-            update_details = check_update()
-        except requests.exceptions.RequestException as e:
-            messagebox = QMessageBox(self)
-            messagebox.setIcon(QMessageBox.Critical)
-            messagebox.setWindowTitle(f"{self.window_name} - Updater Error")
-            messagebox.setText(f"Failed to check the availability of program updates!\n{e}")
-            messagebox.exec()
-            return
+        """Query for program updates in the background, answers arrive as signals"""
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        cache_file = os.path.join(cache_dir, "bwflasher_update.json") if cache_dir else None
 
-        if not update_details:
-            return
+        self.update_checker = UpdateChecker(cache_file)
+        self.update_checker.update_available.connect(self.update_available_messagebox)
+        self.update_checker.update_error.connect(self.update_error_messagebox)
+        self.update_checker.start()
+
+    def update_error_messagebox(self, error):
+        messagebox = QMessageBox(self)
+        messagebox.setIcon(QMessageBox.Critical)
+        messagebox.setWindowTitle(f"{self.window_name} - Updater Error")
+        messagebox.setText(f"Failed to check the availability of program updates!\n{error}")
+        messagebox.exec()
 
+    def update_available_messagebox(self, update_details):
         new_version = update_details["tag_name"]
         url_download = update_details["html_url"]
 
@@ -729,12 +1197,15 @@ By clicking 'Accept', you acknowledge these risks and agree to use responsibly.
 
         x = messagebox.exec()
         if x == QMessageBox.StandardButton.Yes:
+            import webbrowser
             webbrowser.open(url_download)
-            sys.exit(0)
+            self.close()
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setOrganizationName("ScooterTeam")
+    app.setApplicationName("bwflasher")
     window = FirmwareUpdateGUI()
     window.show()
     sys.exit(app.exec())
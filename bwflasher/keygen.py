@@ -18,6 +18,10 @@
 # - ShareAlike — If you remix, transform, or build upon the material, you must distribute your contributions under the same license as the original.
 #
 
+from functools import lru_cache
+from operator import itemgetter
+
+
 def print_array(arr):
     print(' '.join(f'{x:02X}' for x in arr[:16]))
 
@@ -51,42 +55,46 @@ def gen_key(dst, src, lookup_table_0, lookup_table_1):
 
 def xor_byte_blocks(dst, src, block_index):
     """XOR 4-byte blocks from two arrays."""
-    for j in range(block_index * 16, (block_index + 1) * 16):
-        dst[j % 16] ^= src[j]
+    start = block_index * 16
+    dst[:16] = (
+        int.from_bytes(dst[:16], 'little') ^ int.from_bytes(src[start:start+16], 'little')
+    ).to_bytes(16, 'little')
 
 
-def manipulate_bytes(dst_src, c=-0x1b):
-    """ Irreversible byte mutation (in-place). """
-    def to_char(byte):
-        return byte if byte < 128 else byte - 256
+# Masks for treating 16 bytes as one little-endian int of four 4-byte columns
+_EACH_BYTE = int.from_bytes(b'\x01' * 16, 'little')
+_EACH_COLUMN = int.from_bytes(b'\x01\x00\x00\x00' * 4, 'little')
+_COLUMN_LO8 = 0xFF * _EACH_COLUMN
+_COLUMN_LO16 = 0xFFFF * _EACH_COLUMN
+_COLUMN_LO24 = 0xFFFFFF * _EACH_COLUMN
 
-    def get_sign(byte):
-        return byte >> 7  # return -1 if to_char(byte) < 0 else 0
 
-    local = [0, 0, 0, 0, 0]
-    for offset in range(0, 16, 4):
-        local[0] = dst_src[offset] ^ dst_src[offset + 1]
-        local[1] = dst_src[offset + 1] ^ dst_src[offset + 2]
-        local[2] = dst_src[offset + 2] ^ dst_src[offset + 3]
-        local[3] = dst_src[offset + 3] ^ dst_src[offset + 0]
-        local[4] = local[0] ^ local[2]
+def manipulate_bytes(dst_src, c=-0x1b):
+    """
+    Irreversible byte mutation (in-place).
 
-        for i in range(4):
-            dst_src[offset + i] ^= (local[i] << 1) & 0xFF
-            dst_src[offset + i] ^= get_sign(to_char(local[i])) * c
-            dst_src[offset + i] ^= local[4]
+    For every 4-byte column b, with local[i] = b[i] ^ b[(i + 1) % 4]:
+    b[i] ^= (local[i] << 1) ^ b[0] ^ b[1] ^ b[2] ^ b[3], folding the bit
+    shifted out of local[i] back in as -c. The four columns are handled
+    at once as lanes of one 128-bit int.
+    """
+    v = int.from_bytes(dst_src[:16], 'little')
 
+    # b[i + 1] in place of b[i], wrapping around within each column
+    next_byte = ((v >> 8) & _COLUMN_LO24) | ((v & _COLUMN_LO8) << 24)
+    local = v ^ next_byte
+    # local[i] ^ local[i + 2] is the XOR of the whole column
+    column = local ^ (((local >> 16) & _COLUMN_LO16) | ((local & _COLUMN_LO16) << 16))
+    shifted = (local << 1) & (0xFE * _EACH_BYTE)
+    carry = ((local >> 7) & _EACH_BYTE) * -c
 
-def roll_bytes(bytearr, indices):
-    # Extract the values at the given indices
-    values = [bytearr[i] for i in indices]
+    dst_src[:16] = (v ^ shifted ^ carry ^ column).to_bytes(16, 'little')
 
-    # Roll the values to the next position
-    rolled_values = values[1:] + values[:1]
 
-    # Assign the rolled values back to the bytearray
-    for i, index in enumerate(indices):
-        bytearr[index] = rolled_values[i]
+# Source index of every byte after one round's rotation: the bytes in each
+# group 1/5/9/13, 2/10, 3/15/11/7 and 6/14 move one position along
+ROTATE_PERM = (0, 5, 10, 15, 4, 9, 14, 3, 8, 13, 2, 7, 12, 1, 6, 11)
+_rotate = itemgetter(*ROTATE_PERM)
 
 
 def sign_rand_with_key(dst, src, lookup_table):
@@ -96,22 +104,24 @@ def sign_rand_with_key(dst, src, lookup_table):
             manipulate_bytes(dst)
         xor_byte_blocks(dst, src, current_block)
 
-        # Transform dst_array with lookup table and rotation
-        for outer_index in range(0, 16, 4):
-            for inner_index in range(4):
-                table_index = dst[inner_index + outer_index]
-                dst[inner_index + outer_index] = lookup_table[table_index]
-
-        # Rotate the bytes
-        roll_bytes(dst, [1, 5, 9, 13])
-        roll_bytes(dst, [2, 10])
-        roll_bytes(dst, [3, 15, 11, 7])
-        roll_bytes(dst, [6, 14])
+        # Transform dst_array with lookup table and rotation, in one gather
+        dst[:16] = _rotate(dst[:16].translate(lookup_table))
 
     # Final XOR operation
     xor_byte_blocks(dst, src, 10)
 
 
+@lru_cache(maxsize=8)
+def expand_key(uid: bytes, lookup_table_0: bytes, lookup_table_1: bytes) -> bytes:
+    """
+    Key schedule for `uid`. A flash signs several challenges for the same
+    UID and firmware, so the expanded key is only computed once.
+    """
+    key = bytearray(176)
+    gen_key(key, uid, lookup_table_0, lookup_table_1)
+    return bytes(key)
+
+
 def sign_rand(
     uid: bytearray(16),
     rand: bytearray(16),
@@ -123,16 +133,12 @@ def sign_rand(
     Sign challenge `rand` with key generated from `uid`,
     using tables from `fw`.
     """
-    lookup_table_0 = bytearray(256)
-    for i in range(256):
-        lookup_table_0[i] = fw[fw_offset_0+i]
+    lookup_table_0 = bytes(fw[fw_offset_0:fw_offset_0+256])
 
-    lookup_table_1 = bytearray(1+10)
-    for i in range(1, 1+10):  # byte0 is not used
-        lookup_table_1[i] = fw[fw_offset_1+i]
+    # byte0 is not used
+    lookup_table_1 = bytes(1) + fw[fw_offset_1+1:fw_offset_1+1+10]
 
-    key = bytearray(176)
-    gen_key(key, uid, lookup_table_0, lookup_table_1)
+    key = expand_key(bytes(uid), lookup_table_0, lookup_table_1)
 
     dst = bytearray(rand)
     sign_rand_with_key(dst, key, lookup_table_0)
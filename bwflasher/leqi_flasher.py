@@ -8,26 +8,36 @@
 # To view a copy of this license, visit http://creativecommons.org/licenses/by-nc-sa/4.0/
 # or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
 
+import re
 import serial
 import struct
 import time
-from serial.serialutil import SerialException
+from binascii import crc_hqx
+from serial.serialutil import SerialException, Timeout
 
 from bwflasher.base_flasher import BaseFlasher, FlasherException, FirmwareType
 
+# Every byte value with its bits in reverse order
+_BITREV8 = bytes(int(f'{i:08b}'[::-1], 2) for i in range(256))
+
 
 class LeqiFlasher(BaseFlasher):
     """Flasher for LEQI scooter firmware (encrypted with XOR 0xAA)"""
 
+    FIRMWARE_TYPE = FirmwareType.LEQI
+
     # Constants from reverse engineering
     ENCRYPTION_KEY = 0xAA
     CRC16_POLY = 0x1021  # CRC-16/XMODEM polynomial (for packet validation)
     CRC16_POLY_FIRMWARE = 0x8005  # CRC-16 polynomial for firmware validation (with bit reversal)
     CHUNK_SIZE = 128
+    CHUNK_INTERVAL = 0.044  # 44ms from a chunk's reply to the next chunk
+    READ_TIMEOUT = 0.1  # Port timeout, reads loop on it until their own deadline
     PACKET_HEADER = b'\x5A\x12'
 
     FIRMWARE_OFFSET = 0x80      # Firmware starts at offset 128 in full image
     FIRMWARE_SIZE = 0x9880      # Expected firmware size (39040 bytes)
+    PADDING_RUN = re.compile(rb'\xAA{501,}')  # AA padding is over 500 bytes long
 
     def __init__(
         self,
@@ -36,12 +46,16 @@ class LeqiFlasher(BaseFlasher):
         debug: bool = False,
         status_callback=None,
         progress_callback=None,
-        log_callback=None
+        log_callback=None,
+        simulate_realtime: bool = False
     ):
         super().__init__(tty_port, simulation, debug, status_callback, progress_callback, log_callback)
+        # Simulate the real flash timing instead of running through at once
+        self.simulate_realtime = simulate_realtime
         self.serial_conn = None
         self.encrypted_fw = None
         self.fw_size = 0
+        self._chunk_packets = []
         self.session_start_time = None
 
     @classmethod
@@ -65,12 +79,9 @@ class LeqiFlasher(BaseFlasher):
 
         return firmware_data
 
-    def load_file(self, firmware_file: str):
-        """Load and validate LEQI firmware file"""
-        self.debug_log(f"Loading LEQI firmware file: {firmware_file}")
-
-        with open(firmware_file, 'rb') as f:
-            self.fw = f.read()
+    def load_bytes(self, firmware_data: bytes):
+        """Load and validate LEQI firmware already read from a file"""
+        self.fw = firmware_data
 
         # Check if it's encrypted firmware (should have 0xAA patterns)
         if self.detect_firmware_type(self.fw) != FirmwareType.LEQI:
@@ -82,6 +93,11 @@ class LeqiFlasher(BaseFlasher):
 
         self.fw_size = self.calculate_firmware_size(self.encrypted_fw)
 
+        # Only fw_size bytes get sent, padded once with 0xFF to whole chunks
+        padded_size = self.fw_size + (-self.fw_size % self.CHUNK_SIZE)
+        self.encrypted_fw = self.encrypted_fw[:self.fw_size].ljust(padded_size, b'\xFF')
+        self._chunk_packets = self._build_all_packets()
+
         self.log(f"Loaded LEQI firmware: {len(self.fw)} bytes")
         self.log(f"Firmware size (AA padding end): 0x{self.fw_size:X} ({self.fw_size} bytes)")
 
@@ -90,24 +106,16 @@ class LeqiFlasher(BaseFlasher):
         if not self.encrypted_fw:
             raise FlasherException("No firmware loaded. Call load_file() first.")
 
+        self.cancel_requested = False
+
         if self.simulation:
             self.log("Simulation mode - running simulated LEQI firmware flash")
             self._run_simulation()
             return
 
         try:
-            # Open serial port
-            self.serial_conn = serial.Serial(
-                port=self.tty_port,
-                baudrate=19200,
-                bytesize=serial.EIGHTBITS,
-                parity=serial.PARITY_NONE,
-                stopbits=serial.STOPBITS_ONE,
-                timeout=2.0
-            )
-
-            self.log(f"Serial port opened: {self.tty_port} @ 19200 baud")
-            self.session_start_time = time.time()
+            self._open_serial()
+            self.session_start_time = time.monotonic()
 
             # Flush buffers
             self.serial_conn.reset_input_buffer()
@@ -125,7 +133,6 @@ class LeqiFlasher(BaseFlasher):
             self.emit_status("Finalizing firmware update...")
             self._send_end_command()
 
-            self.serial_conn.close()
             self.log("✓ SUCCESS: LEQI firmware update completed")
             self.emit_progress(100)
 
@@ -134,59 +141,61 @@ class LeqiFlasher(BaseFlasher):
         except Exception as e:
             raise FlasherException(f"Unexpected error: {e}")
 
+    def _open_serial(self):
+        """Open the serial port, reusing an already open connection"""
+        if self.serial_conn and self.serial_conn.is_open:
+            return
+
+        self.serial_conn = serial.Serial(
+            port=self.tty_port,
+            baudrate=19200,
+            bytesize=serial.EIGHTBITS,
+            parity=serial.PARITY_NONE,
+            stopbits=serial.STOPBITS_ONE,
+            timeout=self.READ_TIMEOUT
+        )
+        self.log(f"Serial port opened: {self.tty_port} @ 19200 baud")
+
     def _run_simulation(self):
         """Run simulated LEQI firmware flash with TX/RX logging"""
-        import time
+        sleep = time.sleep if self.simulate_realtime else (lambda seconds: None)
+        chunk_interval = self.CHUNK_INTERVAL
 
         # Simulate start command
         self.emit_status("SIMULATION: Sending firmware update start command...")
-        start_packet = bytearray([0x5A, 0x12, 0x03, 0x06])
-        start_packet.append(0x31)
-        start_packet.append(0x00)
-        start_packet.extend(struct.pack('<H', self.fw_size))
-        start_packet.extend([0x00, 0x00])
-        crc = self.crc16_standard(start_packet)
-        start_packet.extend(struct.pack('>H', crc))
-
-        tx_hex = ' '.join(f'{b:02X}' for b in start_packet)
-        self.debug_log(f"TX: {tx_hex}")
-        time.sleep(0.044)  # 44ms delay
+        start_packet = self._build_start_packet()
+
+        if self.debug:
+            tx_hex = start_packet.hex(' ').upper()
+            self.debug_log(f"TX: {tx_hex}")
+        sleep(chunk_interval)
 
         # Simulate start response
         start_response = bytes([0x5A, 0x21, 0x03, 0x01, 0x01, 0x68, 0x26])
-        rx_hex = ' '.join(f'{b:02X}' for b in start_response)
-        self.debug_log(f"RX: {rx_hex}")
+        if self.debug:
+            rx_hex = start_response.hex(' ').upper()
+            self.debug_log(f"RX: {rx_hex}")
         self.emit_progress(5)
 
         # Simulate firmware data chunks
         self.emit_status("SIMULATION: Sending firmware data...")
-        total_chunks = (self.fw_size + self.CHUNK_SIZE - 1) // self.CHUNK_SIZE
-
-        for chunk_num in range(1, total_chunks + 1):
-            offset = (chunk_num - 1) * self.CHUNK_SIZE
-            chunk_end = min(offset + self.CHUNK_SIZE, self.fw_size)
-            chunk_data = self.encrypted_fw[offset:chunk_end]
-
-            # Pad last chunk to 128 bytes
-            if len(chunk_data) < self.CHUNK_SIZE:
-                chunk_data = chunk_data + b'\xFF' * (self.CHUNK_SIZE - len(chunk_data))
+        total_chunks = len(self._chunk_packets)
+        check_cancelled = self.check_cancelled
 
-            # Build full packet with data and CRC
-            packet = bytearray([0x5A, 0x12, 0x04, 0x84])
-            packet.extend(struct.pack('<I', offset))
-            packet.extend(chunk_data)
-            crc = self.crc16_standard(packet)
-            packet.extend(struct.pack('>H', crc))
+        for chunk_num, packet in enumerate(self._chunk_packets, 1):
+            check_cancelled()
 
             # Only log every 10th chunk to avoid spam
             if chunk_num % 10 == 0 or chunk_num == 1:
-                tx_hex = ' '.join(f'{b:02X}' for b in packet)
-                self.debug_log(f"TX: {tx_hex}")
+                if self.debug:
+                    tx_hex = packet.hex(' ').upper()
+                    self.debug_log(f"TX: {tx_hex}")
 
                 # Simulate response
                 data_response = bytes([0x5A, 0x21, 0x04, 0x01, 0x01, 0xED, 0xB6])
-                rx_hex = ' '.join(f'{b:02X}' for b in data_response)
-                self.debug_log(f"RX: {rx_hex}")
+                if self.debug:
+                    rx_hex = data_response.hex(' ').upper()
+                    self.debug_log(f"RX: {rx_hex}")
 
                 progress = 5 + int((chunk_num / total_chunks) * 85)
                 self.emit_progress(progress)
@@ -197,49 +206,48 @@ class LeqiFlasher(BaseFlasher):
                 else:
                     self.log(progress_msg)
 
-            time.sleep(0.044)  # 44ms delay between chunks
+            sleep(chunk_interval)
 
         self.emit_status("SIMULATION: Finalizing firmware update...")
         self.emit_progress(95)
 
         # Simulate end command
-        end_packet = bytearray([0x5A, 0x12, 0x05, 0x00])
-        crc = self.crc16_standard(end_packet)
-        end_packet.extend(struct.pack('>H', crc))
-        tx_hex = ' '.join(f'{b:02X}' for b in end_packet)
-        self.debug_log(f"TX: {tx_hex}")
-        time.sleep(0.044)  # 44ms delay
+        end_packet = self._with_crc(b'\x5A\x12\x05\x00')
+        if self.debug:
+            tx_hex = end_packet.hex(' ').upper()
+            self.debug_log(f"TX: {tx_hex}")
+        sleep(chunk_interval)
 
         # Simulate end response
         end_response = bytes([0x5A, 0x21, 0x05, 0x01, 0x01, 0x55, 0xA7])
-        rx_hex = ' '.join(f'{b:02X}' for b in end_response)
-        self.debug_log(f"RX: {rx_hex}")
+        if self.debug:
+            rx_hex = end_response.hex(' ').upper()
+            self.debug_log(f"RX: {rx_hex}")
 
         self.log("✓ SIMULATION: LEQI firmware update completed successfully")
         self.emit_progress(100)
 
     def test_connection(self):
         """Test connection to LEQI controller by sending a DeviceInfo command."""
+        self.cancel_requested = False
         if self.simulation:
             self.log("Simulation mode - testing LEQI protocol")
             self.emit_status("Simulating connection test...")
 
             # Simulate sending a DeviceInfo packet
-            test_packet_data = bytearray([0x5A, 0x12, 0x02, 0x00])
-            crc = self.crc16_standard(test_packet_data)
-            test_packet = test_packet_data + bytearray(struct.pack('>H', crc))
+            test_packet = self._with_crc(b'\x5A\x12\x02\x00')
 
-            tx_hex = ' '.join(f'{b:02X}' for b in test_packet)
-            self.debug_log(f"TX (simulated): {tx_hex}")
+            if self.debug:
+                tx_hex = test_packet.hex(' ').upper()
+                self.debug_log(f"TX (simulated): {tx_hex}")
 
             # Simulate DeviceInfo response
             # MCU Version: 0120, HW Version: 0.1.0.0, Region: EU1
-            response_data = bytearray([0x5A, 0x21, 0x02, 0x0B, 0x00, 0x01, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x45, 0x55, 0x31])
-            crc = self.crc16_standard(response_data)
-            response = response_data + bytearray(struct.pack('>H', crc))
+            response = self._with_crc(bytes([0x5A, 0x21, 0x02, 0x0B, 0x00, 0x01, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x45, 0x55, 0x31]))
 
-            rx_hex = ' '.join(f'{b:02X}' for b in response)
-            self.debug_log(f"RX (simulated): {rx_hex}")
+            if self.debug:
+                rx_hex = response.hex(' ').upper()
+                self.debug_log(f"RX (simulated): {rx_hex}")
 
             version_bytes = response[4:8]
             fw_version = "".join(map(str, version_bytes))
@@ -251,20 +259,10 @@ class LeqiFlasher(BaseFlasher):
             return
 
         try:
-            self.serial_conn = serial.Serial(
-                port=self.tty_port,
-                baudrate=19200,
-                bytesize=serial.EIGHTBITS,
-                parity=serial.PARITY_NONE,
-                stopbits=serial.STOPBITS_ONE,
-                timeout=2.0
-            )
-            self.log(f"Serial port opened: {self.tty_port} @ 19200 baud")
+            self._open_serial()
 
             # Build DeviceInfo packet (0x02)
-            packet_data = bytearray([0x5A, 0x12, 0x02, 0x00])
-            crc = self.crc16_standard(packet_data)
-            packet = packet_data + bytearray(struct.pack('>H', crc))
+            packet = self._with_crc(b'\x5A\x12\x02\x00')
 
             response = self._send_and_receive(packet, "DeviceInfo", expected_len=17)
 
@@ -287,10 +285,6 @@ class LeqiFlasher(BaseFlasher):
             raise e
         except Exception as e:
             raise FlasherException(f"An unexpected error occurred during connection test: {e}")
-        finally:
-            if self.serial_conn and self.serial_conn.is_open:
-                self.serial_conn.close()
-                self.log("Serial port closed.")
 
     @staticmethod
     def detect_firmware_type(firmware_data: bytes) -> FirmwareType:
@@ -300,45 +294,38 @@ class LeqiFlasher(BaseFlasher):
 
         # Check for LEQI firmware (encrypted with 0xAA)
         # Look for the characteristic "aa a2" pattern (0xAA XORed address in little-endian)
-        # and high concentration of 0xAA bytes
-        aa_a2_pattern = b'\xaa\xa2'
-        aa_a2_count = firmware_data[0x80:0x400].count(aa_a2_pattern)
-        aa_count = firmware_data[0x80:0x400].count(0xAA)
+        # and high concentration of 0xAA bytes. Counting in place with
+        # start/end avoids copying the region, and most non-LEQI images
+        # already fail the cheaper single byte test
+        aa_count = firmware_data.count(b'\xaa', 0x80, 0x400)
+        if aa_count <= 50:
+            return FirmwareType.UNKNOWN
 
         # LEQI encrypted firmware has many "aa a2" patterns (encrypted pointers)
         # and overall high 0xAA byte concentration
-        if aa_a2_count > 10 and aa_count > 50:
+        aa_a2_pattern = b'\xaa\xa2'
+        aa_a2_count = firmware_data.count(aa_a2_pattern, 0x80, 0x400)
+        if aa_a2_count > 10:
             return FirmwareType.LEQI
 
         return FirmwareType.UNKNOWN
 
     def bit_reverse_8(self, value):
         """Reverse bits in an 8-bit value"""
-        result = 0
-        for i in range(8):
-            if value & (1 << i):
-                result |= 1 << (7 - i)
-        return result & 0xFF
+        return _BITREV8[value & 0xFF]
 
     def bit_reverse_16(self, value):
         """Reverse bits in a 16-bit value"""
-        result = 0
-        for i in range(16):
-            if value & (1 << i):
-                result |= 1 << (15 - i)
-        return result & 0xFFFF
+        return (_BITREV8[value & 0xFF] << 8) | _BITREV8[(value >> 8) & 0xFF]
 
     def crc16_standard(self, data):
         """CRC-16/XMODEM for packet verification"""
-        crc = 0x0000
-        for byte in data:
-            crc ^= byte << 8
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = ((crc << 1) ^ self.CRC16_POLY) & 0xFFFF
-                else:
-                    crc = (crc << 1) & 0xFFFF
-        return crc & 0xFFFF
+        # crc_hqx is CRC16_POLY, non-reflected; with a zero start it is XMODEM
+        return crc_hqx(data, 0x0000)
+
+    def _with_crc(self, packet):
+        """Append the big-endian packet CRC"""
+        return packet + struct.pack('>H', self.crc16_standard(packet))
 
     def calculate_firmware_size(self, firmware_data):
         """Calculate firmware size by finding end of AA padding"""
@@ -346,19 +333,12 @@ class LeqiFlasher(BaseFlasher):
         max_aa_length = 0
         max_aa_end = 0
 
-        i = 0
-        while i < len(data):
-            if data[i] == 0xAA:
-                start = i
-                while i < len(data) and data[i] == 0xAA:
-                    i += 1
-                length = i - start
-
-                if length > max_aa_length and length > 500:
-                    max_aa_length = length
-                    max_aa_end = i
-            else:
-                i += 1
+        # The regex engine scans for the runs, the first longest one wins
+        for run in self.PADDING_RUN.finditer(data):
+            length = run.end() - run.start()
+            if length > max_aa_length:
+                max_aa_length = length
+                max_aa_end = run.end()
 
         if max_aa_end > 0:
             fw_size = ((max_aa_end + 127) // 128) * 128
@@ -368,65 +348,90 @@ class LeqiFlasher(BaseFlasher):
         else:
             return len(data)
 
+    def _build_all_packets(self):
+        """Build every data packet up front, so sending them is only I/O"""
+        packets = []
+        # Slices of a memoryview don't copy, the data goes straight into the packet
+        firmware = memoryview(self.encrypted_fw)
+
+        for offset in range(0, self.fw_size, self.CHUNK_SIZE):
+            chunk_data = firmware[offset:offset + self.CHUNK_SIZE]
+
+            # Build packet: [5A] [12] [04] [LEN=0x84] [OFFSET32_LE] [DATA×128] [CRC_H] [CRC_L]
+            packet = b'\x5A\x12\x04\x84' + struct.pack('<I', offset) + chunk_data
+            packets.append(self._with_crc(packet))
+
+        return packets
+
+    def _build_start_packet(self):
+        """Build the firmware update start command (0x03)"""
+        # [5A] [12] [03] [LEN=0x06] [31] [00] [SIZE16_LE] [00] [00] [CRC_H] [CRC_L]
+        return self._with_crc(struct.pack(
+            '<4sBBHBB',
+            b'\x5A\x12\x03\x06',
+            0x31,  # Version/flag byte
+            0x00,  # Padding
+            self.fw_size,  # Firmware size (16-bit LE)
+            0x00, 0x00  # Padding
+        ))
+
     def _send_start_command(self):
         """Send firmware update start command (0x03)"""
-        start_packet = bytearray([0x5A, 0x12, 0x03, 0x06])
-        start_packet.append(0x31)  # Version/flag byte
-        start_packet.append(0x00)  # Padding
-        start_packet.extend(struct.pack('<H', self.fw_size))  # Firmware size (16-bit LE)
-        start_packet.extend([0x00, 0x00])  # Padding
-
-        crc = self.crc16_standard(start_packet)
-        start_packet.extend(struct.pack('>H', crc))
+        start_packet = self._build_start_packet()
 
-        response = self._send_and_receive(start_packet, "Start", expected_len=7)
+        self._send_packet(start_packet, "Start")
+        response = self._recv_response7(0x03)
 
-        if not response or len(response) < 5 or response[1] != 0x21 or response[2] != 0x03:
+        if not response:
             raise FlasherException("Invalid start response from controller")
 
         self.log("✓ Start command acknowledged")
 
     def _send_firmware_data(self):
-        """Send firmware data in 128-byte chunks"""
-        offset = 0
+        """Send the prebuilt 128-byte data chunks"""
         chunk_num = 0
         failed_chunks = 0
-        total_chunks = (self.fw_size + self.CHUNK_SIZE - 1) // self.CHUNK_SIZE
-
-        while offset < self.fw_size:
-            chunk_end = min(offset + self.CHUNK_SIZE, self.fw_size)
-            chunk_data = self.encrypted_fw[offset:chunk_end]
-
-            # Pad last chunk to 128 bytes
-            if len(chunk_data) < self.CHUNK_SIZE:
-                chunk_data = chunk_data + b'\xFF' * (self.CHUNK_SIZE - len(chunk_data))
-
-            # Build packet: [5A] [12] [04] [LEN=0x84] [OFFSET32_LE] [DATA×128] [CRC_H] [CRC_L]
-            packet = bytearray([0x5A, 0x12, 0x04, 0x84])
-            packet.extend(struct.pack('<I', offset))
-            packet.extend(chunk_data)
-
-            crc = self.crc16_standard(packet)
-            packet.extend(struct.pack('>H', crc))
+        total_chunks = len(self._chunk_packets)
+
+        # Looked up once instead of on every chunk
+        monotonic = time.monotonic
+        sleep = time.sleep
+        send_packet = self._send_packet
+        recv_response = self._recv_response7
+        check_cancelled = self.check_cancelled
+        emit_progress = self.emit_progress
+        chunk_size = self.CHUNK_SIZE
+        chunk_interval = self.CHUNK_INTERVAL
+        next_send = monotonic()
+        last_progress = -1
+
+        for packet in self._chunk_packets:
+            check_cancelled()
+            offset = chunk_num * chunk_size
+
+            # Delay between chunks. It runs from the previous reply, so the
+            # checks, logging and progress updates below are part of it
+            delay = next_send - monotonic()
+            if delay > 0:
+                sleep(delay)
 
             chunk_num += 1
-            response = self._send_and_receive(packet, f"Chunk {chunk_num} @ 0x{offset:04X}", expected_len=7)
+            send_packet(packet, f"Chunk {chunk_num} @ 0x{offset:04X}")
+            response = recv_response(0x04)
+            next_send = monotonic() + chunk_interval
 
             if not response:
-                self.log(f"WARNING: No response for chunk {chunk_num}")
-                failed_chunks += 1
-            elif len(response) < 5 or response[1] != 0x21 or response[2] != 0x04:
-                self.log(f"WARNING: Invalid response format for chunk {chunk_num}")
+                self.log(f"WARNING: No valid response for chunk {chunk_num}")
                 failed_chunks += 1
-            elif len(response) >= 5 and response[4] != 0x01:
+            elif response[4] != 0x01:
                 self.log(f"ERROR: Chunk {chunk_num} REJECTED (status=0x{response[4]:02X})")
                 failed_chunks += 1
 
-            offset = chunk_end
-
-            # Update progress
+            # Update progress, only when the percentage actually changes
             progress = int((chunk_num / total_chunks) * 90)  # 0-90% for data transfer
-            self.emit_progress(progress)
+            if progress != last_progress:
+                emit_progress(progress)
+                last_progress = progress
 
             if chunk_num % 10 == 0:
                 progress_msg = f"Progress: {chunk_num}/{total_chunks} chunks ({progress}%)"
@@ -435,9 +440,6 @@ class LeqiFlasher(BaseFlasher):
                 else:
                     self.log(progress_msg)
 
-            # Delay between chunks
-            time.sleep(0.044)
-
         if failed_chunks > 0:
             raise FlasherException(f"{failed_chunks} chunks had invalid/missing responses")
 
@@ -448,9 +450,7 @@ class LeqiFlasher(BaseFlasher):
 
     def _send_end_command(self):
         """Send firmware update end command (0x05)"""
-        end_packet = bytearray([0x5A, 0x12, 0x05, 0x00])
-        crc = self.crc16_standard(end_packet)
-        end_packet.extend(struct.pack('>H', crc))
+        end_packet = self._with_crc(b'\x5A\x12\x05\x00')
 
         # Retry end command up to 10 times
         response = None
@@ -458,22 +458,17 @@ class LeqiFlasher(BaseFlasher):
         end_timeout = 0.4
 
         for attempt in range(1, max_retries + 1):
+            self.check_cancelled()
             if attempt > 1:
                 self.log(f"Retry {attempt}/{max_retries}...")
                 time.sleep(0.06)
 
-            response = self._send_and_receive(
-                end_packet,
-                f"End (attempt {attempt})",
-                expected_len=7,
-                timeout=end_timeout
-            )
+            self._send_packet(end_packet, f"End (attempt {attempt})")
+            response = self._recv_response7(0x05, timeout=end_timeout)
 
-            if response and len(response) >= 5 and response[1] == 0x21 and response[2] == 0x05:
+            if response:
                 break
 
-            response = None
-
         if not response:
             raise FlasherException(f"No valid response to end command after {max_retries} attempts")
 
@@ -481,54 +476,71 @@ class LeqiFlasher(BaseFlasher):
 
     def _send_and_receive(self, packet, description, expected_len=7, timeout=None):
         """Send packet and read response"""
-        if timeout is None:
-            timeout = 2.0
-
-        # Flush input buffer
-        self.serial_conn.reset_input_buffer()
+        self._send_packet(packet, description)
+        return self._read_response(expected_len, timeout)
+
+    def _send_packet(self, packet, description):
+        """Send packet, dropping any unread input first"""
+        # Drop anything left over from an earlier reply. The buffers are
+        # flushed once in run(), a tty flush per packet costs a driver round
+        # trip on some USB adapters
+        stale = self.serial_conn.in_waiting
+        if stale:
+            self.serial_conn.read(stale)
 
         # Send packet
-        tx_time = time.time()
         self.serial_conn.write(packet)
         self.serial_conn.flush()
 
-        tx_hex = ' '.join(f'{b:02X}' for b in packet)
-        self.debug_log(f"TX [{description}]: {tx_hex}")
+        if self.debug:
+            tx_hex = packet.hex(' ').upper()
+            self.debug_log(f"TX [{description}]: {tx_hex}")
+
+    def _read_response(self, expected_len, timeout=None):
+        """Read a response of expected_len bytes within timeout seconds, None if no header arrives"""
+        if timeout is None:
+            timeout = 2.0
+
+        # Let pyserial block for the reply instead of polling in_waiting. The
+        # port timeout is left as _open_serial() set it, changing it costs a
+        # port reconfiguration, so wait in READ_TIMEOUT steps until the deadline
+        timer = Timeout(timeout)
+        read = self.serial_conn.read
+        read_until = self.serial_conn.read_until
+
+        # Skip anything before the header byte (0x5A)
+        header = read_until(b'\x5A')
+        while not header.endswith(b'\x5A'):
+            if timer.expired():
+                self.debug_log(f"RX: <timeout after {timeout}s>")
+                return None
+            header = read_until(b'\x5A')
+
+        # Read rest of response, a short reply returns once the timeout expires
+        response = bytearray(b'\x5A')
+        while len(response) < expected_len:
+            response += read(expected_len - len(response))
+            if timer.expired():
+                break
+        response = bytes(response)
 
-        # Small delay for controller to respond
-        time.sleep(0.05)
+        if self.debug:
+            rx_hex = response.hex(' ').upper()
+            self.debug_log(f"RX: {rx_hex} ({len(response)} bytes)")
 
-        # Read response
-        response = bytearray()
-        start_time = time.time()
+        return response
 
-        # Look for header byte (0x5A)
-        while time.time() - start_time < timeout:
-            if self.serial_conn.in_waiting > 0:
-                byte = self.serial_conn.read(1)
-                if byte[0] == 0x5A:
-                    response.append(byte[0])
-                    break
-            time.sleep(0.01)
+    def _recv_response7(self, expected_cmd, timeout=None):
+        """
+        Read a fixed-size [5A] [21] [CMD] [LEN] [STATUS] [CRC_H] [CRC_L] reply.
+        Returns None unless it is a complete reply to expected_cmd.
+        """
+        response = self._read_response(7, timeout)
+        if not response:
+            return None
 
-        if len(response) == 0:
-            self.debug_log(f"RX: <timeout after {timeout}s>")
+        if len(response) != 7 or response[1] != 0x21 or response[2] != expected_cmd:
+            self.debug_log(f"RX: not a reply to command 0x{expected_cmd:02X}")
             return None
 
-        # Read rest of response
-        while time.time() - start_time < timeout:
-            if self.serial_conn.in_waiting > 0:
-                byte = self.serial_conn.read(1)
-                response.append(byte[0])
-                if len(response) >= expected_len:
-                    break
-            elif len(response) >= 5:
-                time.sleep(0.02)
-                if self.serial_conn.in_waiting == 0:
-                    break
-            time.sleep(0.01)
-
-        rx_hex = ' '.join(f'{b:02X}' for b in response)
-        self.debug_log(f"RX: {rx_hex} ({len(response)} bytes)")
-
-        return bytes(response)
+        return response
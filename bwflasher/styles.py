@@ -5,27 +5,47 @@
 # Copyright (C) 2024-2025 ScooterTeam
 #
 
-DARK_THEME_STYLESHEET = """
+from functools import lru_cache
+from string import Template
+
+# Color palette for the application
+COLOR_PALETTE = {
+    'primary': '#0ea5e9',       # Fresh sky blue
+    'primary_dark': '#0284c7',  # Darker sky blue
+    'primary_light': '#38bdf8', # Lighter sky blue
+    'background': '#0d1117',    # GitHub dark
+    'surface': '#161b22',       # Surface color
+    'text': '#e6e6e6',          # Light grey text
+    'text_secondary': '#7d8590', # Muted text
+    'border': '#30363d',        # Border color
+    'error': '#f85149',         # Error color
+    'success': '#3fb950',       # Success color
+    'warning': '#d29922',       # Warning color
+    'accent': '#0ea5e9'         # Sky blue accent
+}
+
+# Palette colors are filled in as ${name} by get_dark_theme_stylesheet()
+_DARK_THEME_TEMPLATE = Template("""
 /* Professional 'Terminal' Theme for BWFlasher */
 QWidget {
     font-family: 'Fira Code', 'Consolas', 'Monaco', monospace;
     font-size: 12pt;
-    color: #e6e6e6;
+    color: ${text};
     font-weight: 400;
 }
 
 /* Main Window */
 QWidget#mainWindow {
     background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-        stop:0 #0d1117, stop:0.3 #161b22, stop:0.7 #21262d, stop:1 #30363d);
+        stop:0 ${background}, stop:0.3 ${surface}, stop:0.7 #21262d, stop:1 ${border});
     border: none;
 }
 
 /* Application Title */
-QLabel#titleLabel {
+#titleLabel {
     font-size: 17px;
     font-weight: 600;
-    color: #0ea5e9;
+    color: ${primary};
     padding: 12px 16px;
     background: rgba(14, 165, 233, 0.08);
     border-radius: 4px;
@@ -35,6 +55,31 @@ QLabel#titleLabel {
     line-height: 1.2;
 }
 
+/* Firmware type, colored by the fwState property */
+QLabel#firmwareTypeLabel {
+    background-color: #2b2b2b;
+    padding: 8px 12px;
+    border-radius: 4px;
+    font-weight: bold;
+    border: 1px solid #3a3a3a;
+}
+
+QLabel#firmwareTypeLabel[fwState="unknown"] {
+    color: #999999;
+}
+
+QLabel#firmwareTypeLabel[fwState="ok"] {
+    background-color: #1e3a1e;
+    border: 1px solid #2d5a2d;
+    color: #66ff66;
+}
+
+QLabel#firmwareTypeLabel[fwState="error"] {
+    background-color: #3a3a1e;
+    border: 1px solid #5a5a2d;
+    color: #ffff66;
+}
+
 /* Specific widget styling */
 QComboBox#serialCombo {
     min-width: 200px;
@@ -71,23 +116,23 @@ QTextEdit#logOutput {
 
 /* Input Fields */
 QLineEdit, QComboBox {
-    border: 1px solid #30363d;
+    border: 1px solid ${border};
     border-radius: 4px;
     padding: 6px 10px;
-    background: #0d1117;
-    color: #e6e6e6;
+    background: ${background};
+    color: ${text};
     font-size: 12pt;
     font-weight: 400;
     selection-background-color: #58a6ff;
 }
 
 QLineEdit:focus, QComboBox:focus {
-    border: 1px solid #0ea5e9;
-    background: #161b22;
+    border: 1px solid ${primary};
+    background: ${surface};
 }
 
 QLineEdit::placeholder {
-    color: #7d8590;
+    color: ${text_secondary};
     font-style: normal;
 }
 
@@ -100,26 +145,26 @@ QComboBox::down-arrow {
     image: none;
     border-left: 4px solid transparent;
     border-right: 4px solid transparent;
-    border-top: 4px solid #0ea5e9;
+    border-top: 4px solid ${primary};
     margin-right: 4px;
 }
 
 QComboBox QAbstractItemView {
-    background: #0d1117;
-    border: 1px solid #30363d;
+    background: ${background};
+    border: 1px solid ${border};
     border-radius: 4px;
-    selection-background-color: #0ea5e9;
-    color: #e6e6e6;
+    selection-background-color: ${primary};
+    color: ${text};
     outline: none;
 }
 
 /* Buttons */
 QPushButton {
-    border: 1px solid #30363d;
+    border: 1px solid ${border};
     border-radius: 4px;
     padding: 8px 16px;
     background: #21262d;
-    color: #e6e6e6;
+    color: ${text};
     font-weight: 500;
     font-size: 12pt;
     min-width: 100px;
@@ -127,29 +172,29 @@ QPushButton {
 }
 
 QPushButton:hover {
-    background: #30363d;
-    border: 1px solid #0ea5e9;
-    color: #0ea5e9;
+    background: ${border};
+    border: 1px solid ${primary};
+    color: ${primary};
 }
 
 QPushButton:pressed {
-    background: #0d1117;
+    background: ${background};
     border: 1px solid #58a6ff;
     color: #58a6ff;
 }
 
 QPushButton:disabled {
-    background: #161b22;
-    color: #7d8590;
+    background: ${surface};
+    color: ${text_secondary};
     border: 1px solid #21262d;
 }
 
 /* Progress Bar */
 QProgressBar {
-    border: 1px solid #30363d;
+    border: 1px solid ${border};
     border-radius: 2px;
     text-align: center;
-    background: #0d1117;
+    background: ${background};
     color: #ffffff;
     font-weight: 600;
     font-size: 9pt;
@@ -157,17 +202,17 @@ QProgressBar {
 }
 
 QProgressBar::chunk {
-    background: #0ea5e9;
+    background: ${primary};
     border-radius: 1px;
     margin: 1px;
 }
 
 /* Text Edit (Log Output) */
 QTextEdit {
-    border: 1px solid #30363d;
+    border: 1px solid ${border};
     border-radius: 4px;
-    background: #0d1117;
-    color: #e6e6e6;
+    background: ${background};
+    color: ${text};
     padding: 8px;
     font-family: 'Fira Code', 'Consolas', 'Monaco', monospace;
     font-size: 8pt;
@@ -176,13 +221,13 @@ QTextEdit {
 }
 
 QTextEdit:focus {
-    border: 1px solid #0ea5e9;
+    border: 1px solid ${primary};
 }
 
 /* Checkboxes */
 QCheckBox {
     spacing: 8px;
-    color: #e6e6e6;
+    color: ${text};
     font-size: 12pt;
     font-weight: 400;
 }
@@ -190,33 +235,33 @@ QCheckBox {
 QCheckBox::indicator {
     width: 14px;
     height: 14px;
-    border: 1px solid #30363d;
+    border: 1px solid ${border};
     border-radius: 2px;
-    background: #0d1117;
+    background: ${background};
 }
 
 QCheckBox::indicator:hover {
-    border: 1px solid #0ea5e9;
-    background: #161b22;
+    border: 1px solid ${primary};
+    background: ${surface};
 }
 
 QCheckBox::indicator:checked {
-    background: #0ea5e9;
-    border: 1px solid #0ea5e9;
+    background: ${primary};
+    border: 1px solid ${primary};
     image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTAiIGhlaWdodD0iOCIgdmlld0JveD0iMCAwIDEwIDgiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xIDMuOEwzLjggNi42TDkgMSIgc3Ryb2tlPSIjMGQxMTE3IiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlLWxpbmVqb2luPSJyb3VuZCIvPgo8L3N2Zz4K);
 }
 
 QCheckBox::indicator:checked:hover {
-    background: #38bdf8;
-    border: 1px solid #38bdf8;
+    background: ${primary_light};
+    border: 1px solid ${primary_light};
 }
 
 
 /* Status Bar */
 QStatusBar {
-    border-top: 1px solid #30363d;
-    background: #0d1117;
-    color: #7d8590;
+    border-top: 1px solid ${border};
+    background: ${background};
+    color: ${text_secondary};
     font-size: 8pt;
     font-weight: 400;
     padding: 4px;
@@ -224,26 +269,26 @@ QStatusBar {
 
 /* Labels */
 QLabel {
-    color: #e6e6e6;
+    color: ${text};
     font-size: 12pt;
     font-weight: 400;
 }
 
 /* Scrollbars */
 QScrollBar:vertical {
-    background: #0d1117;
+    background: ${background};
     width: 8px;
     border-radius: 4px;
 }
 
 QScrollBar::handle:vertical {
-    background: #30363d;
+    background: ${border};
     border-radius: 4px;
     min-height: 20px;
 }
 
 QScrollBar::handle:vertical:hover {
-    background: #0ea5e9;
+    background: ${primary};
 }
 
 QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
@@ -252,10 +297,10 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
 
 /* Tooltips */
 QToolTip {
-    background: #0d1117;
+    background: ${background};
     border: 1px solid #1f6feb;
     border-radius: 4px;
-    color: #e6e6e6;
+    color: ${text};
     padding: 6px;
     font-size: 8pt;
     font-weight: 400;
@@ -263,8 +308,8 @@ QToolTip {
 
 /* Message Boxes */
 QMessageBox {
-    background: #0d1117;
-    color: #e6e6e6;
+    background: ${background};
+    color: ${text};
 }
 
 QMessageBox QPushButton {
@@ -272,52 +317,62 @@ QMessageBox QPushButton {
     min-height: 24px;
 }
 
+QDialog#disclaimerDialog {
+    background: ${background};
+    color: ${text};
+}
+
+QDialog#disclaimerDialog QPushButton {
+    min-width: 80px;
+    min-height: 24px;
+}
+
 /* File Dialog - Guaranteed Dark Theme */
 QFileDialog {
-    background: #0d1117;
-    color: #e6e6e6;
+    background: ${background};
+    color: ${text};
 }
 
 QFileDialog QListView {
-    background: #0d1117;
-    color: #e6e6e6;
-    border: 1px solid #30363d;
+    background: ${background};
+    color: ${text};
+    border: 1px solid ${border};
     border-radius: 4px;
 }
 
 QFileDialog QListView::item {
-    background: #0d1117;
-    color: #e6e6e6;
+    background: ${background};
+    color: ${text};
     padding: 4px;
 }
 
 QFileDialog QListView::item:selected {
-    background: #0ea5e9;
+    background: ${primary};
     color: #ffffff;
 }
 
 QFileDialog QListView::item:hover {
-    background: #161b22;
-    color: #e6e6e6;
+    background: ${surface};
+    color: ${text};
 }
 
 QFileDialog QLineEdit {
-    background: #0d1117;
-    color: #e6e6e6;
-    border: 1px solid #30363d;
+    background: ${background};
+    color: ${text};
+    border: 1px solid ${border};
     border-radius: 4px;
     padding: 6px 10px;
 }
 
 QFileDialog QLineEdit:focus {
-    border: 1px solid #0ea5e9;
-    background: #161b22;
+    border: 1px solid ${primary};
+    background: ${surface};
 }
 
 QFileDialog QPushButton {
     background: #21262d;
-    color: #e6e6e6;
-    border: 1px solid #30363d;
+    color: ${text};
+    border: 1px solid ${border};
     border-radius: 4px;
     padding: 8px 16px;
     min-width: 80px;
@@ -325,28 +380,28 @@ QFileDialog QPushButton {
 }
 
 QFileDialog QPushButton:hover {
-    background: #30363d;
-    border: 1px solid #0ea5e9;
-    color: #0ea5e9;
+    background: ${border};
+    border: 1px solid ${primary};
+    color: ${primary};
 }
 
 QFileDialog QPushButton:pressed {
-    background: #0d1117;
-    border: 1px solid #0ea5e9;
-    color: #0ea5e9;
+    background: ${background};
+    border: 1px solid ${primary};
+    color: ${primary};
 }
 
 QFileDialog QComboBox {
-    background: #0d1117;
-    color: #e6e6e6;
-    border: 1px solid #30363d;
+    background: ${background};
+    color: ${text};
+    border: 1px solid ${border};
     border-radius: 4px;
     padding: 6px 10px;
 }
 
 QFileDialog QComboBox:focus {
-    border: 1px solid #0ea5e9;
-    background: #161b22;
+    border: 1px solid ${primary};
+    background: ${surface};
 }
 
 QFileDialog QComboBox::drop-down {
@@ -358,78 +413,75 @@ QFileDialog QComboBox::down-arrow {
     image: none;
     border-left: 4px solid transparent;
     border-right: 4px solid transparent;
-    border-top: 4px solid #0ea5e9;
+    border-top: 4px solid ${primary};
     margin-right: 4px;
 }
 
 QFileDialog QComboBox QAbstractItemView {
-    background: #0d1117;
-    border: 1px solid #30363d;
+    background: ${background};
+    border: 1px solid ${border};
     border-radius: 4px;
-    selection-background-color: #0ea5e9;
-    color: #e6e6e6;
+    selection-background-color: ${primary};
+    color: ${text};
     outline: none;
 }
 
 QFileDialog QLabel {
-    color: #e6e6e6;
+    color: ${text};
     font-size: 12pt;
     font-weight: 400;
 }
 
 QFileDialog QTreeView {
-    background: #0d1117;
-    color: #e6e6e6;
-    border: 1px solid #30363d;
+    background: ${background};
+    color: ${text};
+    border: 1px solid ${border};
     border-radius: 4px;
 }
 
 QFileDialog QTreeView::item {
-    background: #0d1117;
-    color: #e6e6e6;
+    background: ${background};
+    color: ${text};
     padding: 2px;
 }
 
 QFileDialog QTreeView::item:selected {
-    background: #0ea5e9;
+    background: ${primary};
     color: #ffffff;
 }
 
 QFileDialog QTreeView::item:hover {
-    background: #161b22;
-    color: #e6e6e6;
+    background: ${surface};
+    color: ${text};
 }
 
 QFileDialog QHeaderView::section {
-    background: #161b22;
-    color: #e6e6e6;
-    border: 1px solid #30363d;
+    background: ${surface};
+    color: ${text};
+    border: 1px solid ${border};
     padding: 4px;
 }
 
 QFileDialog QHeaderView::section:hover {
     background: #21262d;
-    color: #0ea5e9;
+    color: ${primary};
 }
 
 /* Checkbox glow when checked */
 QCheckBox#simulationCheck:checked, QCheckBox#debugCheck:checked {
-    color: #0ea5e9;
+    color: ${primary};
 }
-"""
+""")
 
-# Color palette for the application
-COLOR_PALETTE = {
-    'primary': '#0ea5e9',       # Fresh sky blue
-    'primary_dark': '#0284c7',  # Darker sky blue
-    'primary_light': '#38bdf8', # Lighter sky blue
-    'background': '#0d1117',    # GitHub dark
-    'surface': '#161b22',       # Surface color
-    'text': '#e6e6e6',          # Light grey text
-    'text_secondary': '#7d8590', # Muted text
-    'border': '#30363d',        # Border color
-    'error': '#f85149',         # Error color
-    'success': '#3fb950',       # Success color
-    'warning': '#d29922',       # Warning color
-    'accent': '#0ea5e9'         # Sky blue accent
-} 
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def get_dark_theme_stylesheet():
+    """The dark theme stylesheet, with the palette colors filled in"""
+    return _DARK_THEME_TEMPLATE.substitute(COLOR_PALETTE)
+
+
+def __getattr__(name):
+    # DARK_THEME_STYLESHEET is only built when something asks for it
+    if name == 'DARK_THEME_STYLESHEET':
+        return get_dark_theme_stylesheet()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,28 +18,125 @@
 # - ShareAlike — If you remix, transform, or build upon the material, you must distribute your contributions under the same license as the original.
 #
 
-import requests
+import json
+import os
+import re
+import time
+from functools import lru_cache
 from platform import python_version
 from bwflasher import __version__
 
 BWFLASHER_RELEASES = "https://api.github.com/repos/scooterteam/bw-flasher/releases"
-REQUESTS_HEADERS = {
-    'User-Agent': f'BWFlasher/{__version__} Python/{python_version()} python-requests/{requests.__version__}'
-}
+REQUESTS_TIMEOUT = (3, 5)  # connect, read
+UPDATE_CHECK_INTERVAL = 6 * 60 * 60  # seconds between release checks
+
+_RELEASE_RE = re.compile(r'v?(\d+(?:\.\d+)*)')
+
+
+def _parse_version(version: str):
+    """
+    Return a plain release version like v0.7.0 as a tuple of ints.
+    Anything else, including pre-releases like v0.7.0-rc1, gives None,
+    so those are never offered as an update.
+    """
+    match = _RELEASE_RE.fullmatch(version.strip())
+    if not match:
+        return None
+    release = tuple(int(part) for part in match.group(1).split('.'))
+    # 0.7 and 0.7.0 are the same release
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+    return release
+
+
+_CURRENT_VERSION = _parse_version(__version__)
+
+
+@lru_cache(maxsize=1)
+def _get_session():
+    # requests is only imported once an update check actually goes out, it
+    # is a large import that the window does not need to show up
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    # Reuse one connection to GitHub for the whole process, and retry once
+    # if it was dropped or a flaky network lost the request
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': f'BWFlasher/{__version__} Python/{python_version()} python-requests/{requests.__version__}',
+        'Accept-Encoding': 'gzip',
+    })
+    # A Retry-After from GitHub could stall the check far beyond the timeouts
+    retries = Retry(total=1, backoff_factor=0.3, respect_retry_after_header=False)
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retries))
+    return session
 
 
 def get_name():
     return f"BWFlasher v{__version__}"
 
 
-def check_update() -> dict:
-    gh_req = requests.get(BWFLASHER_RELEASES, headers=REQUESTS_HEADERS, timeout=3)
-    if gh_req.status_code != 200:
+def _load_update_cache(cache_file: str) -> dict:
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
         return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_update_cache(cache_file: str, release: dict, etag: str = None, last_modified: str = None):
+    # Write next to the cache and rename over it, so an interrupted write
+    # never leaves a truncated cache behind
+    tmp_file = cache_file + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump({'ts': time.time(), 'release': release, 'etag': etag, 'last_modified': last_modified}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def check_update(cache_file: str = None) -> dict:
+    """
+    Return the latest release if it is newer than this version, else {}.
+    With a cache_file, a result younger than UPDATE_CHECK_INTERVAL is reused
+    instead of querying GitHub again. Older results are revalidated with
+    their ETag or Last-Modified date, an unchanged release list then costs
+    an empty 304 reply.
+    """
+    cache = _load_update_cache(cache_file) if cache_file else {}
+    if cache and time.time() - cache.get('ts', 0) < UPDATE_CHECK_INTERVAL:
+        release = cache.get('release') or {}
+    else:
+        headers = {}
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+
+        gh_req = _get_session().get(BWFLASHER_RELEASES, headers=headers, timeout=REQUESTS_TIMEOUT)
+        if gh_req.status_code == 304:
+            release = cache.get('release') or {}
+            etag = cache.get('etag')
+            last_modified = cache.get('last_modified')
+        elif gh_req.status_code == 200:
+            gh_json = gh_req.json()[0]
+            release = {'tag_name': gh_json['tag_name'], 'html_url': gh_json['html_url']}
+            etag = gh_req.headers.get('ETag')
+            last_modified = gh_req.headers.get('Last-Modified')
+        else:
+            return {}
+
+        if cache_file:
+            _save_update_cache(cache_file, release, etag, last_modified)
 
-    gh_json = gh_req.json()[0]
-    if gh_json['tag_name'].strip('v') > __version__:
-        return gh_json
+    # Compare numerically, as strings v0.10 would sort before v0.9
+    latest = _parse_version(release['tag_name']) if release else None
+    if latest and _CURRENT_VERSION and latest > _CURRENT_VERSION:
+        return release
 
     return {}
 
@@ -18,36 +18,69 @@
 # - ShareAlike — If you remix, transform, or build upon the material, you must distribute your contributions under the same license as the original.
 #
 
+from functools import lru_cache
 from io import BytesIO
+import mmap
 import zipfile
 
+# A ZIP starts with a local file header, or the end record when it's empty
+_ZIP_SIGNATURES = (b'PK\x03\x04', b'PK\x05\x06')
 
-def find_pattern_offsets(pattern_hex, binary_data, start_offset=0):
+
+class _FirmwareMap(mmap.mmap):
+    """Read-only file mapping that zipfile accepts like an open file."""
+
+    # mmap only grew seekable() in Python 3.13
+    def seekable(self):
+        return True
+
+    def seek(self, pos, whence=0):
+        # zipfile expects files to raise OSError when seeking before the start
+        try:
+            return super().seek(pos, whence)
+        except ValueError as e:
+            raise OSError(str(e)) from None
+
+
+@lru_cache(maxsize=128)
+def _parse_hex(pattern_hex: str) -> bytes:
+    # Callers scan for the same few signatures, parse each of them only once
+    return bytes.fromhex(pattern_hex)
+
+
+def find_pattern_offsets(pattern_hex, binary_data, start_offset=0, allow_overlap=False):
+    """pattern_hex is a hex string like '637C', or the pattern bytes themselves."""
     offsets = []
     if not pattern_hex:
         return offsets
 
-    pattern = bytes.fromhex(pattern_hex)
+    if isinstance(pattern_hex, (bytes, bytearray)):
+        pattern = pattern_hex
+    else:
+        pattern = _parse_hex(pattern_hex)
 
-    offset = binary_data.find(pattern, start_offset)
+    # bytes.find already skips ahead with memchr in C, only hits reach Python
+    find = binary_data.find
+    # Resume after the whole match, unless overlapping matches are wanted
+    step = 1 if allow_overlap else len(pattern)
+    offset = find(pattern, start_offset)
     while offset != -1:
         offsets.append(offset)
-        offset = binary_data.find(pattern, offset + 1)
+        offset = find(pattern, offset + step)
 
     return offsets
 
 
 def _decode_model(data: bytes):
     """Tries to decode the model id from the firmware data."""
-    id_ = None
-    try:
-        id_ = data[0x100:0x10f].decode('ascii')
-    except (UnicodeDecodeError, IndexError):
-        try:
-            id_ = data[0x400:0x40e].decode("ascii")
-        except (UnicodeDecodeError, IndexError):
-            pass
-    return id_
+    # Check the bytes up front instead of letting a failed decode raise
+    id_ = data[0x100:0x10f]
+    if id_.isascii():
+        return id_.decode('ascii')
+    id_ = data[0x400:0x40e]
+    if id_.isascii():
+        return id_.decode('ascii')
+    return None
 
 
 def process_firmware(firmware_data: bytes) -> bytes:
@@ -56,27 +89,32 @@ def process_firmware(firmware_data: bytes) -> bytes:
     This is based on the logic from the old Zippy.try_extract method.
     """
     processed_fw = firmware_data
-    try:
-        with zipfile.ZipFile(BytesIO(firmware_data), 'r') as zf:
-            file_list = zf.namelist()
-            if not file_list:
-                raise ValueError("The ZIP file is empty.")
-
-            # Find the file to extract, preferring specific filenames
-            esc_file = next(
-                (name for name in file_list if name.startswith('EC_ESC_Driver') or name.endswith(".enc")),
-                file_list[0]
-            )
-            processed_fw = zf.read(esc_file)
-    except zipfile.BadZipFile:
-        # Not a zip file, use the raw data.
-        pass
+    # Raw images are used as they are, without probing them as a ZIP first
+    if firmware_data[:4] in _ZIP_SIGNATURES:
+        try:
+            # A mapped file is read in place, BytesIO shares the bytes buffer
+            source = firmware_data if isinstance(firmware_data, _FirmwareMap) else BytesIO(firmware_data)
+            with zipfile.ZipFile(source, 'r') as zf:
+                file_list = zf.infolist()
+                if not file_list:
+                    raise ValueError("The ZIP file is empty.")
+
+                # Find the file to extract, preferring specific filenames
+                esc_file = file_list[0]
+                for info in file_list:
+                    if info.filename.startswith('EC_ESC_Driver') or info.filename.endswith(".enc"):
+                        esc_file = info
+                        break
+                processed_fw = zf.read(esc_file)
+        except zipfile.BadZipFile:
+            # Not a zip file, use the raw data.
+            pass
 
     # Decryption logic, similar to Zippy's
     if not _decode_model(processed_fw):
         try:
             import fasttea
-            decrypted_fw = fasttea.decrypt(processed_fw)
+            decrypted_fw = fasttea.decrypt(bytes(processed_fw))
             if _decode_model(decrypted_fw):
                 processed_fw = decrypted_fw
         except Exception:
@@ -85,6 +123,9 @@ def process_firmware(firmware_data: bytes) -> bytes:
 
     if len(processed_fw) > 4096:
         processed_fw = processed_fw[:-2]
+    elif isinstance(processed_fw, mmap.mmap):
+        # Never hand out the mapping, it is closed after loading
+        processed_fw = processed_fw[:]
 
     return processed_fw
 
@@ -95,12 +136,20 @@ def load_and_process_firmware(firmware_file_path: str) -> bytes:
     and decrypts it if it appears to be encrypted.
     """
     try:
-        with open(firmware_file_path, 'rb') as f:
-            raw_data = f.read()
+        f = open(firmware_file_path, 'rb')
     except FileNotFoundError:
         raise FileNotFoundError(f"Firmware file not found: {firmware_file_path}")
 
-    return process_firmware(raw_data)
+    with f:
+        # Map the file instead of reading it into memory up front
+        try:
+            raw_data = _FirmwareMap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return process_firmware(f.read())
+
+        with raw_data:
+            return process_firmware(raw_data)
 
 # TODO: move this to tests/
 def test_find_pattern_offsets():
@@ -129,6 +178,18 @@ def test_find_pattern_offsets():
     expected_offsets = []
     assert find_pattern_offsets(pattern_hex, binary_data) == expected_offsets
 
+    binary_data = b'\xaa\xaa\xaa\xaa\xaa'
+    pattern_hex = 'aaaa'
+    expected_offsets = [0, 2]
+    assert find_pattern_offsets(pattern_hex, binary_data) == expected_offsets
+
+    expected_offsets = [0, 1, 2, 3]
+    assert find_pattern_offsets(pattern_hex, binary_data, allow_overlap=True) == expected_offsets
+
+    pattern = b'\xaa\xaa'
+    expected_offsets = [0, 2]
+    assert find_pattern_offsets(pattern, binary_data) == expected_offsets
+
 def main():
     import argparse
 